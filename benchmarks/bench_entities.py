@@ -0,0 +1,109 @@
+"""
+Simulates program.py's enemies as an EntityStore on the headless backend:
+enemies fly in from the edges of the canvas at the game's speed, the ones
+that leave are replaced, and every tick tests them all against the wizard.
+Reports how long each part of a tick takes.
+
+Example usage:
+    python benchmarks/bench_entities.py
+    python benchmarks/bench_entities.py --enemies 50000 --no-numpy
+    python benchmarks/bench_entities.py --capacity 20000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["MYLIBRARY_HEADLESS"] = "1"
+
+# Like program.py: 1200 pixels in 10 seconds, 75 pixel sprites
+_SPEED = 120
+_SIZE = 75
+_CANVAS = (0, 0, 1000, 600)
+_WIZARD = (425, 275, 475, 325)
+
+
+def _spawn(store):
+    side = random.randint(1, 4)
+    if side == 1:
+        store.add(random.randint(1, 1000), -100, 0, _SPEED, _SIZE, _SIZE)
+    elif side == 2:
+        store.add(-100, random.randint(1, 600), _SPEED, 0, _SIZE, _SIZE)
+    elif side == 3:
+        store.add(random.randint(1, 1000), 700, 0, -_SPEED, _SIZE, _SIZE)
+    else:
+        store.add(1100, random.randint(1, 600), -_SPEED, 0, _SIZE, _SIZE)
+
+
+def run(enemies, ticks, seed, use_numpy=True, capacity=64):
+    from mylibrary import EntityStore
+
+    random.seed(seed)
+    # Starts small so the store has to grow, like a game that keeps spawning
+    store = EntityStore(capacity, use_numpy)
+    for _ in range(enemies):
+        _spawn(store)
+
+    dt = 1 / 60
+    timings = {"update": 0.0, "overlapping": 0.0, "departed": 0.0}
+    hits = 0
+    replaced = 0
+    for _ in range(ticks):
+        started = time.perf_counter()
+        store.update(dt)
+        moved = time.perf_counter()
+        hits += len(store.overlapping(_WIZARD))
+        tested = time.perf_counter()
+        gone = store.departed(_CANVAS)
+        finished = time.perf_counter()
+
+        timings["update"] += moved - started
+        timings["overlapping"] += tested - moved
+        timings["departed"] += finished - tested
+        for entity in gone:
+            store.remove(entity)
+            _spawn(store)
+        replaced += len(gone)
+
+    total = sum(timings.values())
+    results = {
+        "backend": "numpy" if store.numpy else "array",
+        "enemies": len(store),
+        "ticks": ticks,
+    }
+    for name, seconds in timings.items():
+        results[f"{name} (ms/tick)"] = round(seconds / ticks * 1000, 3)
+    results["ticks/s (wall)"] = round(ticks / total) if total else 0
+    results["wizard hits"] = hits
+    results["enemies replaced"] = replaced
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--enemies", type=int, default=20000)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--capacity", type=int, default=64,
+                        help="how many entities the store makes room for at first")
+    parser.add_argument("--no-numpy", action="store_true",
+                        help="use the array module even if NumPy is installed")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.enemies, args.ticks, args.seed, not args.no_numpy, args.capacity)
+    width = max(len(name) for name in results)
+    report = "\n".join(f"{name:<{width}}  {value}" for name, value in results.items())
+    print(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
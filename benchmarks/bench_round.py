@@ -0,0 +1,127 @@
+"""
+Replays a whole round of program.py on the headless backend as fast as
+possible, with scripted WASD input, and reports how hard mylibrary worked.
+
+By default the wizard's health is topped up every frame so the round lasts
+the full game_time and the late, heavy waves are included.
+
+Example usage:
+    python benchmarks/bench_round.py
+    python benchmarks/bench_round.py --seed 7 --output bench_output.txt
+"""
+
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ["MYLIBRARY_HEADLESS"] = "1"
+
+import mylibrary_headless as headless  # noqa: E402
+
+# Keys held in turn, for this many presses each: a patrol around the middle
+_PATROL = [("d", 25), ("s", 15), ("a", 50), ("w", 15), ("d", 25)]
+# Browsers repeat a held key about 30 times a second
+_KEY_REPEAT_MS = 33
+
+
+def _patrol_keys():
+    while True:
+        for key, presses in _PATROL:
+            for _ in range(presses):
+                yield key
+
+
+def run(program, seed, mortal=False, rendering_mode="dom", audio_mode="element", write_mode="direct"):
+    import mylibrary
+    from mylibrary import _core, collision
+
+    mylibrary.set_rendering_mode(rendering_mode)
+    mylibrary.set_audio_mode(audio_mode)
+    if write_mode != "direct":
+        mylibrary.batch_writes(buffer=write_mode == "buffer")
+    namespace = headless.load_program(program, seed)
+
+    seconds = namespace.get("game_time", 135) + 1
+    keys = _patrol_keys()
+    state = {"next_key": 0, "peak_proxies": 0, "peak_tests": 0, "last": (0, 0)}
+    grid = mylibrary.get_collision_index()
+    engine = collision._collision_engine
+
+    def on_frame(now):
+        if not mortal and "wizard_health" in namespace:
+            namespace["wizard_health"] = 100
+        if now >= state["next_key"]:
+            headless.press_key(next(keys))
+            state["next_key"] = now + _KEY_REPEAT_MS
+
+        live = mylibrary.proxy_counts()["live"]
+        state["peak_proxies"] = max(state["peak_proxies"], live)
+
+        # Collision tests done by the ticks since the last frame
+        ticks, tests = engine.ticks, grid.total_candidates
+        last_ticks, last_tests = state["last"]
+        if ticks > last_ticks:
+            per_tick = (tests - last_tests) / (ticks - last_ticks)
+            state["peak_tests"] = max(state["peak_tests"], per_tick)
+        state["last"] = (ticks, tests)
+
+    headless.press_start()
+    started = time.perf_counter()
+    headless.clock.run_for(seconds, on_frame)
+    wall = time.perf_counter() - started
+
+    stats = headless.stats()
+    timer_runs = _core._game_loop.timer_runs
+    return {
+        "virtual seconds": round(stats["time"], 1),
+        "wall seconds": round(wall, 3),
+        "speedup": round(stats["time"] / wall, 1),
+        "timer callbacks": timer_runs,
+        "timer callbacks/s (wall)": round(timer_runs / wall),
+        "collision ticks": engine.ticks,
+        "collision tests": grid.total_candidates,
+        "collision tests/tick (mean)": round(grid.total_candidates / max(engine.ticks, 1), 2),
+        "collision tests/tick (peak)": round(state["peak_tests"], 2),
+        "elements created": stats["elements_created"],
+        "peak live elements": stats["peak_elements"],
+        "peak live proxies": state["peak_proxies"],
+        "peak js proxies": stats["peak_proxies"],
+        "canvas draw calls": stats["draw_calls"],
+        "style writes": stats["style_writes"],
+        "render buffer calls": stats["render_calls"],
+        "sounds played": stats["sounds_played"],
+        "final text": " | ".join(headless.page_text()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--program", default=os.path.join(ROOT, "program.py"))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--mortal", action="store_true",
+                        help="let the wizard die instead of topping up health")
+    parser.add_argument("--rendering-mode", choices=("dom", "canvas"), default="dom",
+                        help="see mylibrary.set_rendering_mode()")
+    parser.add_argument("--audio-mode", choices=("element", "web_audio"), default="element",
+                        help="see mylibrary.set_audio_mode()")
+    parser.add_argument("--write-mode", choices=("direct", "batch", "buffer"), default="direct",
+                        help="see mylibrary.batch_writes()")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.program, args.seed, args.mortal, args.rendering_mode, args.audio_mode,
+                  args.write_mode)
+    width = max(len(name) for name in results)
+    report = "\n".join(f"{name:<{width}}  {value}" for name, value in results.items())
+    print(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
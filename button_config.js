@@ -3,9 +3,27 @@ async function fetchPythonSource() {
   return fetch("./program.py").then((r) => r.text());
 }
 
-// Helper to fetch the library
+// The files of the mylibrary package. Python only imports the submodules a
+// game uses, but they're all fetched up front because imports can't wait.
+const mylibraryFiles = [
+  "__init__.py",
+  "_core.py",
+  "animation.py",
+  "audio.py",
+  "collision.py",
+  "controls.py",
+  "entities.py",
+  "images.py",
+  "layout.py",
+  "widgets.py",
+];
+
+// Helper to fetch the library, as [path, source] pairs
 async function fetchmylibrary() {
-  return fetch("./mylibrary.py").then((r) => r.text());
+  return Promise.all(mylibraryFiles.map((name) => {
+      const path = `mylibrary/${name}`;
+      return fetch(`./${path}`).then((r) => r.text()).then((source) => [path, source]);
+  }));
 }
 
 // Error checking
@@ -28,21 +46,130 @@ function addErrorToDOM(error) {
   }
 }
 
+// Precompiled bytecode from tools/build_bundle.py, if it has been built
+async function fetchBundle() {
+  try {
+      const response = await fetch("./bundle.zip");
+      return response.ok ? new Uint8Array(await response.arrayBuffer()) : null;
+  } catch (e) {
+      return null;
+  }
+}
+
+// Runs program.py, from bundle.zip if it was built from these exact sources
+// by this Python, otherwise from source. Evaluates to whether it used it.
+const runProgram = `
+def _run_program():
+    import hashlib, importlib.util, json, sys, zipfile, zipimport
+
+    # The files the loader wrote. One the bundle doesn't have, like a module
+    # added since it was built, can't be imported with the bundle on sys.path
+    written = ["program.py"] + ["mylibrary/" + name for name in ${JSON.stringify(mylibraryFiles)}]
+
+    try:
+        with zipfile.ZipFile("bundle.zip") as bundle:
+            manifest = json.loads(bundle.read("bundle.json"))
+        fresh = manifest["magic"] == importlib.util.MAGIC_NUMBER.hex() and sorted(
+            manifest["sources"]
+        ) == sorted(written) and all(
+            hashlib.sha256(open(name, "rb").read()).hexdigest() == digest
+            for name, digest in manifest["sources"].items()
+        )
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        fresh = False
+
+    if fresh:
+        sys.path.insert(0, "bundle.zip")
+        code = zipimport.zipimporter("bundle.zip").get_code("program")
+    else:
+        with open("program.py") as file:
+            code = compile(file.read(), "program.py", "exec")
+    exec(code, globals())
+    return fresh
+
+_run_program()
+`;
+
+// Images listed in assets.json, so they can download and decode while
+// Pyodide is still starting
+async function fetchAssetManifest() {
+  try {
+      const response = await fetch("./assets.json");
+      return response.ok ? (await response.json()).images || [] : [];
+  } catch (e) {
+      return [];
+  }
+}
+
+function preloadImages(filenames) {
+  return Promise.all(filenames.map((filename) => {
+      const image = new Image();
+      image.src = filename;
+      // A bad filename is reported by mylibrary once the game uses it
+      return image.decode().catch(() => {});
+  }));
+}
+
+// How long each startup phase took, in milliseconds
+const startupTimings = {};
+window.mylibraryStartupTimings = startupTimings;
+
+function timed(name, promise) {
+  const started = performance.now();
+  return promise.then((value) => {
+      startupTimings[name] = Math.round(performance.now() - started);
+      return value;
+  });
+}
+
 // For if Pyodide loads
 const pyodideLoadedEvent = new Event("PyodideLoaded");
 
 (async () => {
-  let pyodide = await loadPyodide();
-  let librarySource = await fetchmylibrary();
-  pyodide.FS.writeFile("mylibrary.py", librarySource);
+  const started = performance.now();
+
+  // Everything that only needs the network runs at the same time
+  const assetsReady = timed("assets", fetchAssetManifest().then(preloadImages));
+  const [pyodide, librarySources, pythonSourceCode, bundle] = await Promise.all([
+      timed("pyodide", loadPyodide()),
+      timed("mylibrary", fetchmylibrary()),
+      timed("program.py", fetchPythonSource()),
+      timed("bundle.zip", fetchBundle()),
+  ]);
+  // The sources are written even when the bundle is used, so the bundle
+  // can be checked against them and tracebacks can show their lines
+  pyodide.FS.mkdir("mylibrary");
+  for (const [path, source] of librarySources) {
+      pyodide.FS.writeFile(path, source);
+  }
+  pyodide.FS.writeFile("program.py", pythonSourceCode);
+  if (bundle) {
+      pyodide.FS.writeFile("bundle.zip", bundle);
+  }
 
   // Load the main program
-  let pythonSourceCode = await fetchPythonSource();
-  pyodide.runPython(pythonSourceCode);
+  const programStarted = performance.now();
+  const usedBundle = pyodide.runPython(runProgram);
+  startupTimings["run program.py"] = Math.round(performance.now() - programStarted);
+  console.info(usedBundle ? "Loaded precompiled bundle.zip" : "Compiled from source");
+
+  // Don't enable Play until the images from preload_assets() are decoded
+  await Promise.all([assetsReady, timed("preload_assets", Promise.resolve(window.mylibraryPreload))]);
+
+  startupTimings["total"] = Math.round(performance.now() - started);
+  console.table(startupTimings);
 })()
   .then(() => {
       window.dispatchEvent(pyodideLoadedEvent);
       window.addEventListener("error", addErrorToDOM);
+      // Python errors from promises, e.g. a sound that couldn't be fetched.
+      // Others, like an interrupted play(), aren't the game's fault.
+      window.addEventListener("unhandledrejection", (event) => {
+          const message = event.reason && event.reason.message;
+          if (message && message.includes("Traceback")) {
+              addErrorToDOM(event.reason);
+          }
+      });
   })
   .catch((e) => {
       addErrorToDOM(e);
@@ -119,73 +246,21 @@ function enableButtons() {
 
 // Makes the animations play
 function play() {
-    function _translate_x(element, distance, time = null) {
-        function _translate() {
-            element.style.transform = `translateX(${distance}px)`;
-        }
-        element.start_time = Date.now();
-        setTimeout(_translate, 50);
-    }
-  // Disable the start button and enable the other ones
-  disableStartButton();
-  enableButtons();
-    
-
-function _translate_y(element, distance) {
-    function _translate() {
-        element.style.transform = `translateY(${distance}px)`
+    // Disable the start button and enable the other ones
+    disableStartButton();
+    enableButtons();
+    // mylibrary keeps each image's animation state, see _play() in mylibrary/animation.py
+    if (window.mylibraryPlay) {
+        window.mylibraryPlay();
     }
-    element.start_time = Date.now()
-    setTimeout(_translate, 50)
-}
-    const allElements = document.querySelectorAll("#canvas img");
-    allElements.forEach((element) => {
-        element.start_time = Date.now();
-        element.style.transition = `${element.time}s linear transform`;
-        if (element.animation_direction === "right") {
-            _translate_x(element, element.distance_left);
-        } else if (element.animation_direction === "left") {
-            _translate_x(element, -element.distance_left);
-        } else if (element.animation_direction === "up") {
-            _translate_y(element, -element.distance_left);
-        } else if (element.animation_direction === "down") {
-            _translate_y(element, element.distance_left);
-        }
-        
-    });
 }
 
 // Pause button functionality
 function pause() {
-    // Selects all images within the canvas
-    const allElements = document.querySelectorAll("#canvas img");
-    // Set and track positioning/location of each img
-    allElements.forEach((element) => {
-        const rect = element.getBoundingClientRect();
-        const canvasRect = document.querySelector("#canvas").getBoundingClientRect();
-        const top = rect.top - canvasRect.top;
-        const left = rect.left - canvasRect.left;
-        const width = element.style.width;
-        element.style = "";
-        element.style.position = "absolute";
-        element.style.top = top + "px";
-        element.style.left = left + "px";
-        element.style.transition = "";
-        element.style.transform = "";
-        element.style.width = width;
-
-        // Tracks animations within the images in the canvas
-        element.time = element.time - (Date.now() - element.start_time) / 1000;
-        if (element.animation_direction === "left") {
-            element.distance_left = element.distance - (element.start_position - left)
-        } else if (element.animation_direction === "right") {
-            element.distance_left = element.distance - (left - element.start_position);
-        } else if (element.animation_direction === "up") {
-            element.distance_left = element.distance - (element.start_position - top);
-        } else if (element.animation_direction === "down") {
-            element.distance_left = element.distance - (top - element.start_position);
-        }
-    });
+    // Stops the animating images where they are, see _pause() in mylibrary/animation.py
+    if (window.mylibraryPause) {
+        window.mylibraryPause();
+    }
     // Disable pause button but enable start button
     disablePauseButton();
     enableStartButton();
@@ -204,6 +279,11 @@ function start(button) {
     button.remove();
     const bgMusic = document.querySelector("#bg-music");
     if (bgMusic) {
+        // mylibrary doesn't download the music until now, unless it was
+        // loaded while idle. It streams, so play() starts once enough is in.
+        if (!bgMusic.getAttribute("src") && bgMusic.dataset.src) {
+            bgMusic.src = bgMusic.dataset.src;
+        }
         bgMusic.play();
     }
     enableButtons();
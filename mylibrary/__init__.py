@@ -0,0 +1,142 @@
+"""
+mylibrary: make games in the browser with Python.
+
+Only the core (timers, the game loop and clear()) is imported with the
+package. Everything else lives in a submodule that's imported the first time
+one of its names is used, so a game only pays at startup for the parts it
+uses:
+
+    from mylibrary import add_image, animate_right, set_interval
+
+`from mylibrary import *` still works, but imports every submodule.
+"""
+
+from random import randint, choice
+import importlib
+
+from ._core import (
+    Timer,
+    batch_writes,
+    cancel_all,
+    clear,
+    on_update,
+    proxy_counts,
+    set_interval,
+    set_timeout,
+    set_update_rate,
+)
+
+# Lazily imported name -> the submodule it's defined in
+_SUBMODULES = {
+    "animate_down": "animation",
+    "animate_left": "animation",
+    "animate_right": "animation",
+    "animate_up": "animation",
+    "fade_in": "animation",
+    "fade_out": "animation",
+    "vanish": "animation",
+    "add_audio": "audio",
+    "add_background_audio": "audio",
+    "play_audio": "audio",
+    "set_audio_mode": "audio",
+    "set_volume": "audio",
+    "SpatialHash": "collision",
+    "check_collision": "collision",
+    "get_collision_index": "collision",
+    # "controls" rather than "input", which would clash with input()
+    "click": "controls",
+    "input": "controls",
+    "keydown": "controls",
+    "EntityStore": "entities",
+    "add_background": "images",
+    "add_image": "images",
+    "load_atlas": "images",
+    "preload_assets": "images",
+    "set_rendering_mode": "images",
+    "move_down": "layout",
+    "move_left": "layout",
+    "move_right": "layout",
+    "move_up": "layout",
+    "position_element": "layout",
+    "remove_element": "layout",
+    "rotate_element": "layout",
+    "set_element_width": "layout",
+    "add_button": "widgets",
+    "add_text": "widgets",
+    "add_text_input": "widgets",
+    "get_input_value": "widgets",
+    "set_background_color": "widgets",
+    "set_font_size": "widgets",
+    "set_text_color": "widgets",
+    "set_text_decoration": "widgets",
+    "update_text": "widgets",
+}
+
+__all__ = [
+    "EntityStore",
+    "SpatialHash",
+    "Timer",
+    "add_audio",
+    "add_background",
+    "add_background_audio",
+    "add_button",
+    "add_image",
+    "add_text",
+    "add_text_input",
+    "animate_down",
+    "animate_left",
+    "animate_right",
+    "animate_up",
+    "batch_writes",
+    "cancel_all",
+    "check_collision",
+    "choice",
+    "clear",
+    "click",
+    "fade_in",
+    "fade_out",
+    "get_collision_index",
+    "get_input_value",
+    "input",
+    "keydown",
+    "load_atlas",
+    "move_down",
+    "move_left",
+    "move_right",
+    "move_up",
+    "on_update",
+    "play_audio",
+    "position_element",
+    "preload_assets",
+    "proxy_counts",
+    "randint",
+    "remove_element",
+    "rotate_element",
+    "set_audio_mode",
+    "set_background_color",
+    "set_element_width",
+    "set_font_size",
+    "set_interval",
+    "set_rendering_mode",
+    "set_text_color",
+    "set_text_decoration",
+    "set_timeout",
+    "set_update_rate",
+    "set_volume",
+    "update_text",
+    "vanish",
+]
+
+
+def __getattr__(name):
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + submodule, __name__), name)
+    # Later lookups find it without coming back here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
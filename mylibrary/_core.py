@@ -0,0 +1,1065 @@
+"""
+What every part of mylibrary needs: the browser (or the headless stand-in),
+proxies, the write queue, element keys and layout, and the game loop with
+its timers. The other submodules are only imported when a game uses them,
+and hook into the game loop, clear() and element removal through _hooks.
+"""
+
+import os
+
+try:
+    if os.environ.get("MYLIBRARY_HEADLESS"):
+        raise ImportError("headless mode requested")
+    from js import document, setTimeout, requestAnimationFrame, cancelAnimationFrame, window, prompt, Date, localStorage, Promise
+    from pyodide import create_once_callable, create_proxy, to_js
+    from pyodide.http import open_url
+except ImportError:
+    # Not in the browser: run against the in-memory page and virtual clock
+    from mylibrary_headless import document, setTimeout, requestAnimationFrame, cancelAnimationFrame, window, prompt, Date, localStorage, Promise
+    from mylibrary_headless import create_once_callable, create_proxy, to_js, open_url
+from array import array
+from itertools import count
+from math import nan
+import re
+
+
+# flake8: noqa
+
+
+def _is_valid_element(func_name):
+    """
+    Allows us to throw a helpful error message if someone passes a raw value
+    to a function that accepts a DOM element. For some reason, Transcrypt
+    wants this definition before it's used, so it has to be at the top of the
+    file.
+    """
+
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            element = args[0]
+            if isinstance(element, (float, int, str)):
+                raise Exception(
+                    f"""
+Error in {func_name}(), invalid element passed as first argument
+    - '{element}' is not a valid element!
+    - Did you pass an element created with add_image(), add_text(), or add_button() as the first argument?
+"""
+                )
+            # This will catch functions passed in where an element is exepected
+            # or `undefined` JS vars that sneak through.
+            elif callable(element) or not element:
+                raise Exception(
+                    f"""
+Error in {func_name}(), invalid element passed as first argument\n"
+    - Did you pass an element created with add_image(), add_text(), or add_button() as the first argument?
+"""
+                )
+
+            # An element from the page (like an event's target) becomes the
+            # handle mylibrary made for it, see _ElementHandle
+            if not isinstance(element, _ElementHandle):
+                args = (_handle(element),) + args[1:]
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _ProxyRegistry:
+    """
+    Owns every proxy mylibrary hands to JavaScript. Each proxy is filed under
+    an owner (an element key, or None for the library itself) so it can be
+    destroyed, and its event listener removed, when the owner goes away.
+    """
+
+    def __init__(self):
+        # owner -> list of [proxy, event target or None, event type or None]
+        self.owned = {}
+        self.created = 0
+        self.destroyed = 0
+
+    def _track(self, owner, entry):
+        self.owned.setdefault(owner, []).append(entry)
+        self.created += 1
+
+    def _forget(self, owner, entry):
+        entries = self.owned.get(owner)
+        if entries and entry in entries:
+            entries.remove(entry)
+            if not entries:
+                del self.owned[owner]
+            self.destroyed += 1
+
+    def proxy(self, function, owner=None, target=None, event_type=None):
+        entry = [create_proxy(function), target, event_type]
+        self._track(owner, entry)
+        return entry[0]
+
+    def once(self, function, owner=None, target=None, event_type=None):
+        entry = [None, target, event_type]
+
+        def call_once(*args):
+            # The proxy destroys itself after this call
+            self._forget(owner, entry)
+            return function(*args)
+
+        entry[0] = create_once_callable(call_once)
+        self._track(owner, entry)
+        return entry[0]
+
+    def listen(self, target, event_type, function, owner=None, once=False):
+        """Adds an event listener whose proxy is owned by `owner`."""
+        make = self.once if once else self.proxy
+        proxy = make(function, owner, target, event_type)
+        target.addEventListener(event_type, proxy)
+        return proxy
+
+    def release(self, owner, event_type=None):
+        """
+        Removes the listeners and destroys the proxies owned by `owner`, or
+        only the ones for `event_type` if it's given.
+        """
+        entries = self.owned.get(owner)
+        if not entries:
+            return
+
+        for entry in list(entries):
+            if event_type is not None and entry[2] != event_type:
+                continue
+            proxy, target, entry_event_type = entry
+            if target is not None:
+                target.removeEventListener(entry_event_type, proxy)
+            self._forget(owner, entry)
+            proxy.destroy()
+
+    def counts(self):
+        counts = {"elements": 0, "library": 0}
+        for owner, entries in self.owned.items():
+            if owner is None:
+                counts["library"] += len(entries)
+            else:
+                counts["elements"] += len(entries)
+        counts["live"] = counts["elements"] + counts["library"]
+        counts["created"] = self.created
+        counts["destroyed"] = self.destroyed
+        return counts
+
+
+_proxies = _ProxyRegistry()
+
+
+class _ElementHandle:
+    """
+    What add_image(), add_text(), add_button(), add_text_input() and
+    add_audio() return: a Python handle on the element that keeps its styles
+    and text as mylibrary last wrote them, and its animate_*() state, on the
+    Python side. Reading them doesn't cross over to JavaScript, and writing a
+    value the element already has is skipped (see _WriteQueue), so the page
+    is only touched when something changes. Anything else is passed through
+    to the element, so a handle can be used like the element itself.
+    """
+
+    __slots__ = (
+        "element",
+        "mylibrary_key",
+        "tagName",
+        # {style name: value} and {property name: value} as last written or read
+        "styles",
+        "properties",
+        # Set by animate_*(), see _element_motion()
+        "animation_direction",
+        "distance",
+        "distance_left",
+        "time",
+        "start_position",
+        "start_time",
+        "loop_animation",
+    )
+
+    def __init__(self, element, tag_name):
+        self.element = element
+        self.mylibrary_key = next(_element_keys)
+        # So an event's target can be traced back to its handle, see _handle()
+        element.mylibrary_key = self.mylibrary_key
+        self.tagName = tag_name
+        self.styles = {}
+        self.properties = {}
+        self.animation_direction = None
+        self.distance = 0
+        self.distance_left = 0
+        self.time = 0
+        self.start_position = 0
+        self.start_time = None
+        self.loop_animation = False
+
+    def __getattr__(self, name):
+        return getattr(self.element, name)
+
+    def __setattr__(self, name, value):
+        if name in _handle_fields:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.element, name, value)
+
+    def __repr__(self):
+        return f"<handle {self.mylibrary_key} for {self.element!r}>"
+
+
+_handle_fields = frozenset(_ElementHandle.__slots__)
+
+
+class _WriteQueue:
+    """
+    Makes the style (and text) writes that mylibrary does in its hot paths.
+
+    Writes to a handle (see _ElementHandle) that wouldn't change anything are
+    skipped, and reads come from what the handle remembers instead of the
+    page. Normally a write goes straight to the element. With
+    batch_writes(True), writes are queued per element and property, so a
+    later write to the same property replaces an earlier one, and the game
+    loop flushes the queue once per frame. New elements are then only
+    appended at the flush, after their first styles are set.
+
+    With batch_writes(buffer=True), the flush packs each element's left,
+    top, transform and opacity into one record of a typed array, and
+    render_commands.js applies every record in a single call.
+    """
+
+    def __init__(self):
+        self.batching = False
+        # key -> [element, {style name: value}, {property name: value}]
+        self.pending = {}
+        # Elements waiting to be appended: [(parent, element, key)]
+        self.appends = []
+        self.detached = set()
+        # Writes skipped because the element already had the value
+        self.skipped = 0
+        # window.mylibraryRender from render_commands.js, while buffering
+        self.buffer = None
+        # Keys render_commands.js knows the element for, and the ones to tell
+        # it to forget because they have left the page
+        self.registered = set()
+        self.forgotten = []
+
+    def set_style(self, element, name, value, key=None):
+        styles = getattr(element, "styles", None)
+        if styles is not None:
+            if styles.get(name) == value:
+                self.skipped += 1
+                return
+            styles[name] = value
+        if not self.batching:
+            setattr(element.style, name, value)
+            return
+        if key is None:
+            key = _element_key(element)
+        if key in self.detached:
+            # Not on the page yet, so writing it now costs no style work
+            setattr(element.style, name, value)
+            return
+        self._pending(element, key)[1][name] = value
+
+    def set_property(self, element, name, value, key=None):
+        properties = getattr(element, "properties", None)
+        if properties is not None:
+            if properties.get(name) == value:
+                self.skipped += 1
+                return
+            properties[name] = value
+        if not self.batching:
+            setattr(element, name, value)
+            return
+        if key is None:
+            key = _element_key(element)
+        if key in self.detached:
+            setattr(element, name, value)
+            return
+        self._pending(element, key)[2][name] = value
+
+    def get_style(self, element, name, key=None):
+        styles = getattr(element, "styles", None)
+        if styles is None:
+            return getattr(element.style, name)
+        value = styles.get(name)
+        if value is None:
+            # Only read from the page the first time
+            value = styles[name] = getattr(element.style, name)
+        return value
+
+    def resizing(self, key):
+        """Whether a width or height write for the element is still queued."""
+        entry = self.pending.get(key)
+        return entry is not None and ("width" in entry[1] or "height" in entry[1])
+
+    def clear_styles(self, element, key=None):
+        """Removes every inline style from `element`, like `style.cssText = ""`."""
+        if key is None:
+            key = _element_key(element)
+        entry = self.pending.get(key)
+        if entry is not None:
+            entry[1].clear()
+        element.style.cssText = ""
+        styles = getattr(element, "styles", None)
+        if styles is not None:
+            styles.clear()
+
+    def append(self, parent, element):
+        if not self.batching:
+            parent.appendChild(element.element)
+            return
+        key = _element_key(element)
+        self.detached.add(key)
+        self.appends.append((parent, element, key))
+        _game_loop.start()
+
+    def _pending(self, element, key):
+        entry = self.pending.get(key)
+        if entry is None:
+            entry = self.pending[key] = [element, {}, {}]
+            _game_loop.start()
+        return entry
+
+    def flush(self):
+        pending, self.pending = self.pending, {}
+        records = None if self.buffer is None else array("d")
+
+        for key, (element, styles, properties) in pending.items():
+            if records is not None and isinstance(element, _ElementHandle):
+                self._record(records, key, element, styles)
+            if styles:
+                style = element.style
+                for name, value in styles.items():
+                    setattr(style, name, value)
+            for name, value in properties.items():
+                setattr(element, name, value)
+
+        if records is not None:
+            forgotten, self.forgotten = self.forgotten, []
+            for key in forgotten:
+                # Unless it was written to again and registered again
+                if key not in self.registered:
+                    records.extend((-key, nan, nan, nan, nan, nan))
+        # After the other styles, so a transition is set before its transform
+        if records:
+            self.buffer.apply(to_js(records))
+
+        appends, self.appends = self.appends, []
+        for parent, element, key in appends:
+            if key in self.detached:
+                self.detached.discard(key)
+                parent.appendChild(element.element)
+
+    def _record(self, records, key, element, styles):
+        """
+        Moves the values in `styles` that render_commands.js can apply into a
+        record at the end of `records`: the element's key, left, top,
+        transform function and amount, and opacity. NaN leaves a value as it
+        is. Anything else stays in `styles` to be written as usual.
+        """
+
+        before = len(styles)
+        record = [key, nan, nan, nan, nan, nan]
+        for index, name in ((1, "left"), (2, "top")):
+            value = _px(styles.get(name))
+            if value is not None:
+                record[index] = value
+                del styles[name]
+
+        transform = styles.get("transform")
+        if transform == "":
+            record[3] = 0
+            del styles["transform"]
+        elif transform is not None:
+            match = _transform_pattern.fullmatch(transform)
+            if match:
+                record[3] = _TRANSFORMS[match.group(1)]
+                record[4] = float(match.group(2))
+                del styles["transform"]
+
+        opacity = styles.get("opacity")
+        if opacity:
+            try:
+                record[5] = float(opacity)
+                del styles["opacity"]
+            except ValueError:
+                pass
+
+        if len(styles) == before:
+            return
+        if key not in self.registered:
+            self.buffer.register(key, element.element)
+            self.registered.add(key)
+        records.extend(record)
+
+    def forget(self, key, pooled=False):
+        """Drops queued writes for an element that's gone."""
+        self.pending.pop(key, None)
+        self.detached.discard(key)
+        # A pooled image comes back as the same element
+        if key in self.registered and not pooled:
+            self.registered.discard(key)
+            self.forgotten.append(key)
+
+
+_dom_writes = _WriteQueue()
+
+# The transform functions a render command can carry, see render_commands.js
+_TRANSFORMS = {"translateX": 1, "translateY": 2, "rotate": 3}
+_transform_pattern = re.compile(r"(translateX|translateY|rotate)\((-?[\d.]+)(?:px|deg)\)")
+
+
+class _ElementRegistry:
+    """
+    Every element mylibrary has put on the page, by kind, so clear(), the
+    pause button and other bulk work go through the elements themselves
+    instead of searching the page with selectors. Canvas mode sprites aren't
+    elements, so their renderer keeps its own list.
+    """
+
+    KINDS = ("image", "text", "button", "input")
+
+    def __init__(self):
+        # kind -> {key: element}, in the order they were added
+        self.by_kind = {kind: {} for kind in self.KINDS}
+        # key -> kind
+        self.kinds = {}
+
+    def add(self, element, kind):
+        key = _element_key(element)
+        self.by_kind[kind][key] = element
+        self.kinds[key] = kind
+
+    def remove(self, key):
+        kind = self.kinds.pop(key, None)
+        if kind is not None:
+            del self.by_kind[kind][key]
+
+    def get(self, key, default=None):
+        kind = self.kinds.get(key)
+        if kind is None:
+            return default
+        return self.by_kind[kind][key]
+
+    def elements(self, kind):
+        return list(self.by_kind[kind].values())
+
+    def items(self):
+        """(key, element) for every element of every kind."""
+        return [item for kind in self.KINDS for item in self.by_kind[kind].items()]
+
+
+_elements = _ElementRegistry()
+
+
+def _handle(element):
+    """
+    Returns the handle mylibrary made for `element`, which may be the handle
+    itself or the element on the page (e.g. an event's target). Anything
+    else, like a canvas mode sprite, is returned as it is.
+    """
+
+    if isinstance(element, _ElementHandle):
+        return element
+    key = getattr(element, "mylibrary_key", None)
+    if key is None:
+        return element
+    return _elements.get(key, element)
+
+
+# Functions the other submodules add when they're imported, so this module
+# doesn't have to import them:
+#   "forget" (key, pooled) when an element leaves the page, see _forget_element()
+#   "clear" () from clear()
+#   "busy" () -> whether the game loop still has drawing to do
+#   "render" (paused) once per game loop frame, after the writes are flushed
+_hooks = {"forget": [], "clear": [], "busy": [], "render": []}
+
+
+def _forget_element(element, key=None, pooled=False):
+    """
+    Drops the collision pairs and destroys the proxies that belong to an
+    element that is leaving the page. Pooled images keep their source and
+    size so add_image() can reuse them.
+    """
+
+    if key is None:
+        key = getattr(element, "mylibrary_key", None)
+        if key is None:
+            return
+    _proxies.release(key)
+    _dom_writes.forget(key, pooled)
+    _elements.remove(key)
+    _start_gate.forget(key)
+    for forget in _hooks["forget"]:
+        forget(key, pooled)
+    if not pooled:
+        _element_sizes.pop(key, None)
+
+
+def batch_writes(enabled=True, buffer=False):
+    """
+    Turns write batching on or off. While it's on, style and text changes
+    made by mylibrary are queued, repeated changes to the same element and
+    property are merged, and everything is written to the page once per
+    frame. Reads like the current position of an element come from the
+    queued values, so nothing forces the browser to lay out the page early.
+
+    With `buffer`, each frame's positions, transforms and opacities are sent
+    to the page together in one typed array, which render_commands.js
+    applies in a single call, so moving hundreds of images costs one call
+    into JavaScript instead of hundreds.
+
+    Parameters:
+        - enabled (bool): Whether to batch writes (optional).
+        - buffer (bool): Whether to send them as one render command buffer (optional).
+
+    Example usage:
+        batch_writes(buffer=True)
+        for bat in bats:
+            move_right(bat, 5)
+    """
+
+    executor = None
+    if enabled and buffer:
+        executor = getattr(window, "mylibraryRender", None)
+        if executor is None:
+            raise Exception(
+                """
+Error in batch_writes()
+    - buffer=True needs render_commands.js, which isn't loaded on this page!
+"""
+            )
+
+    if not enabled:
+        _dom_writes.flush()
+    _dom_writes.batching = enabled
+    _dom_writes.buffer = executor
+
+
+def cancel_all():
+    """
+    Cancels every timer that's still waiting or repeating, including the ones
+    mylibrary uses for collisions and fast keyboard input. clear() calls this.
+
+    Example usage:
+        def game_over():
+            cancel_all()
+            game_over_text = add_text("Game Over!", 65)
+            position_element(game_over_text, "center", "center")
+    """
+
+    for timer in list(_game_loop.timers):
+        timer.cancel()
+
+
+def clear():
+    """
+    Clear the page of all elements, and cancel every timer (see cancel_all())
+    so nothing keeps running against the removed elements.
+
+    Example usage:
+        def clear_page():
+            clear()
+            after_clear_text = add_text("Page was cleared", 32)
+            position_element(after_clear_text, "center", "center")
+
+
+        before_clear_text = add_text("This is on the page before clearing", 32)
+        position_element(before_clear_text, "center", "center")
+
+        clear_page_button = add_button("Clear Page")
+        position_element(clear_page_button, "center", 400)
+
+        click(clear_page_button, clear_page)
+    """
+
+    cancel_all()
+
+    for key, element in _elements.items():
+        _forget_element(element, key)
+        element.remove()
+
+    for clear_hook in _hooks["clear"]:
+        clear_hook()
+
+
+_element_keys = count(1)
+
+
+def _element_key(element):
+    """
+    Returns a stable integer key for `element`, stored on the element itself
+    so that every Python wrapper of the same DOM node gets the same key.
+    """
+    key = getattr(element, "mylibrary_key", None)
+    if key is None:
+        key = next(_element_keys)
+        element.mylibrary_key = key
+    return key
+
+
+def _element_rect(element, key=None):
+    """
+    Returns the (left, top, right, bottom) of `element` relative to the canvas.
+    """
+
+    return _element_motion(element, key)[0]
+
+
+def _element_motion(element, key=None):
+    """
+    Returns (rect, direction, progress) for `element`, where rect is relative
+    to the canvas, direction is the animate_*() direction (or None) and
+    progress runs from 0 to 1 once the animation has actually started.
+
+    Elements placed with position_element() and moved with animate_*() follow
+    a linear CSS transition, so their rect is worked out from the values those
+    functions store on the element and Date.now() instead of reading layout.
+    Anything else falls back to getBoundingClientRect().
+    """
+
+    if key is None:
+        key = _element_key(element)
+    left = _px(_dom_writes.get_style(element, "left", key))
+    top = _px(_dom_writes.get_style(element, "top", key))
+    if left is None or top is None or getattr(element, "loop_animation", False):
+        return _layout_rect(element), None, None
+
+    size = _element_sizes.get(key)
+    if size is None:
+        size = (element.offsetWidth, element.offsetHeight)
+        # Images report a zero size until they have loaded, and the page's
+        # size is out of date while a new width is waiting to be written
+        if size[0] and size[1] and not _dom_writes.resizing(key):
+            _element_sizes[key] = size
+
+    direction = getattr(element, "animation_direction", None)
+    # _translate_x() and _translate_y() set start_time when the transform is
+    # applied, so until then the element hasn't started moving
+    start_time = getattr(element, "start_time", None)
+    progress = None
+    if direction and start_time is not None:
+        duration = element.time * 1000
+        elapsed = max(Date.now() - start_time, 0)
+        progress = min(elapsed / duration, 1) if duration > 0 else 1
+        offset = element.distance_left * progress
+
+        if direction == "right":
+            left += offset
+        elif direction == "left":
+            left -= offset
+        elif direction == "down":
+            top += offset
+        elif direction == "up":
+            top -= offset
+
+    return (left, top, left + size[0], top + size[1]), direction, progress
+
+
+def _has_left_canvas(rect, direction, progress):
+    """
+    True when an animating element is outside the canvas and the rest of its
+    animation can't bring it back into view.
+    """
+
+    if direction is None or progress is None:
+        return False
+
+    width, height = _canvas_size()
+    if rect[2] > 0 and rect[0] < width and rect[3] > 0 and rect[1] < height:
+        return False
+    if progress >= 1:
+        return True
+
+    if direction in ("left", "right"):
+        if rect[3] <= 0 or rect[1] >= height:
+            return True
+        return (direction == "right" and rect[0] >= width) or (
+            direction == "left" and rect[2] <= 0
+        )
+
+    if rect[2] <= 0 or rect[0] >= width:
+        return True
+    return (direction == "down" and rect[1] >= height) or (
+        direction == "up" and rect[3] <= 0
+    )
+
+
+def _canvas_size():
+    global _canvas_size_cache
+    if _canvas_size_cache is None:
+        canvas = document.getElementById("canvas")
+        if canvas:
+            _canvas_size_cache = (canvas.offsetWidth, canvas.offsetHeight)
+        else:
+            _canvas_size_cache = (window.innerWidth, window.innerHeight)
+    return _canvas_size_cache
+
+
+_canvas_size_cache = None
+
+
+# key -> (width, height), filled the first time a rect is worked out
+_element_sizes = {}
+
+
+def _layout_rect(element):
+    rect = element.getBoundingClientRect()
+    left = rect.left
+    top = rect.top
+
+    canvas = document.getElementById("canvas")
+    if canvas:
+        canvas_rect = canvas.getBoundingClientRect()
+        left -= canvas_rect.left
+        top -= canvas_rect.top
+
+    return (left, top, left + rect.width, top + rect.height)
+
+
+def _px(value):
+    """Turns a CSS pixel value like "120px" into a number, or None if unset."""
+    if value and value.endswith("px"):
+        return float(value[:-2])
+    return None
+
+
+def _filename_not_found(filename, function_name):
+    raise Exception(
+        f"""
+Error in {function_name}()
+    - '{filename}' is not a valid filename!
+"""
+    )
+
+
+def on_update(function_to_run):
+    """
+    Runs `function_to_run` on every update of the game loop, 60 times a second
+    while the game is running. It's given the time (in seconds) each update
+    covers, so movement can be written as speed * dt.
+
+    Parameters:
+        - function_to_run (function): The function to run, which takes `dt`.
+
+    Returns:
+        - A Timer that can be cancelled to stop the updates.
+
+    Example usage:
+        def move_ship(dt):
+            global ship_x
+            ship_x += 120 * dt
+            position_element(ship, ship_x, 100)
+
+
+        on_update(move_ship)
+    """
+
+    if not callable(function_to_run):
+        raise Exception(
+            """
+Error in on_update()
+    - The first argument is not a function!
+"""
+        )
+
+    return Timer(function_to_run, 0, repeat=True, pass_dt=True)
+
+
+def proxy_counts():
+    """
+    Counts the JavaScript proxies mylibrary is keeping alive, which is handy
+    for checking that a long game isn't leaking them.
+
+    Returns:
+        - A dict with the number of live proxies owned by elements and by the
+          library itself, the total live, and how many were ever created and
+          destroyed.
+
+    Example usage:
+        counts = proxy_counts()
+        print(f"{counts['live']} live proxies")
+    """
+
+    return _proxies.counts()
+
+
+def set_timeout(function_to_run, time):
+    """
+    Runs `function_to_run` after `time` seconds.
+
+    Parameters:
+        - function_to_run (function): The function to run.
+        - time (int): The time (in seconds) to wait before running the `function_to_run`.
+
+    Returns:
+        - A Timer that can be cancelled before it runs.
+
+    Example usage:
+        def show_boo_text():
+            boo_text = add_text("BOO!!!", 100)
+            position_element(boo_text, "center", 300)
+
+
+        set_timeout(show_boo_text, 3)
+    """
+
+    return Timer(function_to_run, time)
+
+
+def set_interval(function_to_run, time):
+    """
+    Runs `function_to_run` every `time` seconds.
+
+    Parameters:
+        - function_to_run (function): The function to run.
+        - time (int): The time (in seconds) to wait before running the `function_to_run`.
+
+    Returns:
+        - A Timer that can be cancelled to stop the repeats.
+
+    Example usage:
+        def create_ship():
+            ship = add_image("ship.png", 100)
+            position_element(ship, 2000, 100)
+            animate_right(ship, 2500, 10)
+
+
+        ship_timer = set_interval(create_ship, 3)
+    """
+
+    return Timer(function_to_run, time, repeat=True)
+
+
+def set_update_rate(rate, max_steps=5):
+    """
+    Changes how many fixed updates the game loop runs per second, and how many
+    it will run in one frame to catch up after a slow frame.
+
+    Parameters:
+        - rate (int): Updates per second.
+        - max_steps (int): The most updates to run in a single frame (optional).
+
+    Example usage:
+        set_update_rate(30)
+    """
+
+    _game_loop.step = 1 / rate
+    _game_loop.max_steps = max_steps
+
+
+class Timer:
+    """
+    A handle for a timer started by set_timeout(), set_interval() or
+    on_update(). Timers are run by the game loop, so they only count down
+    while the game is running (after the start button, and not while paused).
+
+    Parameters:
+        - function_to_run (function): The function to run.
+        - time (int): The time (in seconds) before each run. 0 runs it every
+          update.
+        - repeat (bool): Whether to keep running every `time` seconds.
+
+    Example usage:
+        def stop_ships():
+            ship_timer.cancel()
+
+
+        ship_timer = set_interval(create_ship, 3)
+        set_timeout(stop_ships, 30)
+    """
+
+    def __init__(self, function_to_run, time, repeat=False, pass_dt=False):
+        self.function_to_run = function_to_run
+        self.time = time
+        self.repeat = repeat
+        # on_update() callbacks are given the length of each update
+        self.pass_dt = pass_dt
+        self.elapsed = 0
+        self.finished = False
+        self.cancelled = False
+        _game_loop.add_timer(self)
+
+    @property
+    def active(self):
+        """Whether the timer is still waiting to run, or still repeating."""
+        return not (self.cancelled or self.finished)
+
+    def _advance(self, dt):
+        self.elapsed += dt
+        # Allow for float error from adding up fixed steps
+        if self.elapsed + 1e-9 < self.time:
+            return
+
+        if self.repeat:
+            self.elapsed = self.elapsed - self.time if self.time else 0
+        else:
+            self.finished = True
+            _game_loop.remove_timer(self)
+
+        _game_loop.timer_runs += 1
+        if self.pass_dt:
+            self.function_to_run(dt)
+        else:
+            self.function_to_run()
+
+    def cancel(self):
+        """Stops the timer. Does nothing if it has already finished."""
+        if not self.active:
+            return
+        self.cancelled = True
+        _game_loop.remove_timer(self)
+
+
+class _GameLoop:
+    """
+    One requestAnimationFrame loop that runs every Timer at a fixed timestep,
+    so input polling, movement, spawning and collisions all happen in one
+    batch per frame. After a slow frame it catches up by at most `max_steps`
+    steps and drops the rest of the backlog instead of spiralling.
+    """
+
+    def __init__(self, rate=60, max_steps=5):
+        self.step = 1 / rate
+        self.max_steps = max_steps
+        self.timers = []
+        # Functions waiting for a frame, see defer()
+        self.deferred = []
+        self.ready = []
+        self.accumulator = 0
+        self.last_timestamp = None
+        self.frame_id = None
+        self.frame_proxy = None
+        # Timer callbacks run so far, for benchmarks
+        self.timer_runs = 0
+
+    def add_timer(self, timer):
+        self.timers.append(timer)
+        self.start()
+
+    def remove_timer(self, timer):
+        if timer in self.timers:
+            self.timers.remove(timer)
+
+    def defer(self, function_to_run):
+        """
+        Runs `function_to_run` after the browser has rendered at least one
+        frame, e.g. so a CSS transition set just before it takes effect.
+        """
+        self.deferred.append(function_to_run)
+        self.start()
+
+    def start(self):
+        if self.frame_id is not None:
+            return
+        if self.frame_proxy is None:
+            self.frame_proxy = _proxies.proxy(self.frame)
+        self.frame_id = requestAnimationFrame(self.frame_proxy)
+
+    def stop(self):
+        if self.frame_id is not None:
+            cancelAnimationFrame(self.frame_id)
+            self.frame_id = None
+        self.last_timestamp = None
+        self.accumulator = 0
+
+    def frame(self, timestamp):
+        # Ask for the next frame first so an error in a callback can't stop
+        # the loop, unless there is nothing left to run.
+        if not (self.timers or self.deferred or self.ready or _dom_writes.pending
+                or _dom_writes.appends or any(busy() for busy in _hooks["busy"])):
+            self.stop()
+            return
+        self.frame_id = requestAnimationFrame(self.frame_proxy)
+
+        ready, self.ready, self.deferred = self.ready, self.deferred, []
+        for function_to_run in ready:
+            function_to_run()
+
+        paused = _start_gate.waiting
+        if paused or self.last_timestamp is None:
+            # Don't catch up on the time spent paused
+            self.last_timestamp = None if paused else timestamp
+            self.accumulator = 0
+            self.render(paused)
+            return
+
+        self.accumulator += (timestamp - self.last_timestamp) / 1000
+        self.last_timestamp = timestamp
+
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            for timer in list(self.timers):
+                if timer.active:
+                    timer._advance(self.step)
+            self.accumulator -= self.step
+            steps += 1
+
+        if steps == self.max_steps:
+            self.accumulator = min(self.accumulator, self.step)
+
+        self.render(False)
+
+    def render(self, paused):
+        _dom_writes.flush()
+        for render in _hooks["render"]:
+            render(paused)
+
+
+_game_loop = _GameLoop()
+
+
+class _StartGate:
+    """
+    Holds back what shouldn't happen until the start button is pressed
+    (before the game, or while it's paused), like an animation starting or a
+    sound playing. One click listener on the body catches every press of the
+    start button, whichever button it is by then, and runs what's waiting.
+    Once the game is running, run() calls straight through.
+    """
+
+    def __init__(self):
+        # The #start button, looked up again after each press because
+        # button_config.js swaps in a new one on the first
+        self.button = None
+        self.looked_up = False
+        # [(owner key or None, function)] waiting for the start button
+        self.queue = []
+        self.listener = None
+
+    @property
+    def waiting(self):
+        """Whether the start button is waiting to be pressed (before or mid game)."""
+        if not self.looked_up:
+            self.button = document.getElementById("start")
+            self.looked_up = True
+            if self.listener is None:
+                self.listener = _proxies.listen(document.body, "click", self.on_click)
+        return bool(self.button) and not self.button.disabled
+
+    def run(self, function_to_run, owner=None):
+        """
+        Runs `function_to_run` now if the game is running, or else once the
+        start button is pressed. It's dropped if `owner` leaves the page first.
+        """
+        if self.waiting:
+            self.queue.append((owner, function_to_run))
+        else:
+            function_to_run()
+
+    def forget(self, key):
+        if self.queue:
+            self.queue = [entry for entry in self.queue if entry[0] != key]
+
+    def on_click(self, event):
+        # The button's own onclick has already run, so the game is running
+        if not event.target.closest("#start"):
+            return
+        self.looked_up = False
+        queue, self.queue = self.queue, []
+        for owner, function_to_run in queue:
+            function_to_run()
+
+
+_start_gate = _StartGate()
@@ -0,0 +1,389 @@
+"""Animating, fading and vanishing elements."""
+
+from ._core import setTimeout, window, Date
+from ._core import _is_valid_element, _proxies, _dom_writes, _elements, _element_key, _element_rect, _forget_element, _game_loop, _hooks, _start_gate
+
+
+@_is_valid_element("animate_down")
+def animate_down(element, distance, time=8, loop=False):
+    """
+    Animates the element down by the given distance. Can optionally change
+    the amount of time the animation takes and whether the element animates
+    down and up repeatedly.
+
+    Parameters:
+        - element (element): An element to animate.
+        - distance (int): The distance the element should travel (in pixels).
+        - time (int): The amount of seconds the animation should take (optional).
+        - loop (bool): Whether to repeatedly animate down and up.
+
+    Example usage:
+        taco_image = add_image("taco.jpg")
+        animate_down(taco_image, 100)
+    """
+
+    _dom_writes.set_style(element, "transition", f"{time}s linear transform")
+
+    element.distance = distance
+    element.distance_left = distance
+    element.time = time
+    element.loop_animation = loop
+    element.animation_direction = "down"
+
+    start_position = _dom_writes.get_style(element, "top")
+    if start_position:
+        element.start_position = int(float(start_position[:-2]))
+    else:
+        element.start_position = 0
+
+    
+    # Translate once the start button has been pressed, or now if it has
+    _start_gate.run(lambda: _translate_y(element, distance), _element_key(element))
+    
+    if loop:
+        element.animation_direction = "up"
+        _proxies.listen(
+            element,
+            "transitionend",
+            lambda _: _loop_animation(element, distance),
+            _element_key(element),
+        )
+
+
+@_is_valid_element("animate_left")
+def animate_left(element, distance, time=8, loop=False):
+    """
+    Animates the element left by the given distance. Can optionally change
+    the amount of time the animation takes and whether the element animates
+    left and right repeatedly.
+
+    Parameters:
+        - element (element): An element to animate.
+        - distance (int): The distance the element should travel (in pixels).
+        - time (int): The amount of seconds the animation should take (optional).
+        - loop (bool): Whether to repeatedly animate left and right.
+
+    Example usage:
+        taco_image = add_image("taco.jpg")
+        animate_left(taco_image, 100)
+    """
+
+    _dom_writes.set_style(element, "transition", f"{time}s linear transform")
+
+    element.distance = distance
+    element.distance_left = distance
+    element.time = time
+    element.loop_animation = loop
+    element.animation_direction = "left"
+
+    start_position = _dom_writes.get_style(element, "left")
+    if start_position:
+        element.start_position = int(float(start_position[:-2]))
+    else:
+        element.start_position = 0
+
+
+    # Translate once the start button has been pressed, or now if it has
+    _start_gate.run(lambda: _translate_x(element, -distance), _element_key(element))
+
+    if loop:
+        _proxies.listen(
+            element,
+            "transitionend",
+            lambda _: _loop_animation(element, distance),
+            _element_key(element),
+        )
+
+
+@_is_valid_element("animate_right")
+def animate_right(element, distance, time=8, loop=False):
+    """
+    Animates the element right by the given distance. Can optionally change
+    the amount of time the animation takes and whether the element animates
+    right and left repeatedly.
+
+    Parameters:
+        - element (element): An element to animate.
+        - distance (int): The distance the element should travel (in pixels).
+        - time (int): The amount of seconds the animation should take (optional).
+        - loop (bool): Whether to repeatedly animate right and left.
+
+    Example usage:
+        taco_image = add_image("taco.jpg")
+        animate_right(taco_image, 100)
+    """
+
+    _dom_writes.set_style(element, "transition", f"{time}s linear transform")
+
+    element.distance = distance
+    element.distance_left = distance
+    element.time = time
+    element.loop_animation = loop
+    element.animation_direction = "right"
+
+    start_position = _dom_writes.get_style(element, "left")
+    if start_position:
+        element.start_position = int(float(start_position[:-2]))
+    else:
+        element.start_position = 0
+    
+    # Translate once the start button has been pressed, or now if it has
+    _start_gate.run(lambda: _translate_x(element, distance), _element_key(element))
+
+    if loop:
+        _proxies.listen(
+            element,
+            "transitionend",
+            lambda _: _loop_animation(element, distance),
+            _element_key(element),
+        )
+
+
+@_is_valid_element("animate_up")
+def animate_up(element, distance, time=8, loop=False):
+    """
+    Animates the element up by the given distance. Can optionally change
+    the amount of time the animation takes and whether the element animates
+    up and down repeatedly.
+
+    Parameters:
+        - element (element): An element to animate.
+        - distance (int): The distance the element should travel (in pixels).
+        - time (int): The amount of seconds the animation should take (optional).
+        - loop (bool): Whether to repeatedly animate up and down.
+
+    Example usage:
+        taco_image = add_image("taco.jpg")
+        animate_up(taco_image, 100)
+    """
+
+    _dom_writes.set_style(element, "transition", f"{time}s linear transform")
+
+    element.distance = distance
+    element.distance_left = distance
+    element.time = time
+    element.loop_animation = loop
+    element.animation_direction = "up"
+
+    start_position = _dom_writes.get_style(element, "top")
+    if start_position:
+        element.start_position = int(float(start_position[:-2]))
+    else:
+        element.start_position = 0
+
+    # Translate once the start button has been pressed, or now if it has
+    _start_gate.run(lambda: _translate_y(element, -distance), _element_key(element))
+
+    if loop:
+        element.animation_direction = "up"
+        _proxies.listen(
+            element,
+            "transitionend",
+            lambda _: _loop_animation(element, -distance),
+            _element_key(element),
+        )
+
+
+@_is_valid_element("fade_in")
+def fade_in(element):
+    """
+    Fades the `element` from invisible to visible.
+
+    Parameters:
+        - element (element): The element to fade in.
+
+    Example usage:
+        def fade_text_in():
+            fade_in(hidden_text)
+
+
+        hidden_text = add_text("Hidden Text", 32)
+        position_element(hidden_text, "center", 400)
+        fade_out(hidden_text)
+
+        fade_in_button = add_button("Fade In")
+        position_element(fade_in_button, "center", "center")
+        click(fade_in_button, fade_text_in)
+    """
+
+    transition = _dom_writes.get_style(element, "transition")
+    if transition and "opacity 1s linear" not in transition:
+        _dom_writes.set_style(element, "transition", transition + ", opacity 1s linear")
+    else:
+        _dom_writes.set_style(element, "transition", "opacity 1s linear")
+
+    element.classList.remove("fade-out")
+    element.classList.add("fade-in")
+
+
+@_is_valid_element("fade_out")
+def fade_out(element):
+    """
+    Fades the `element` from visible to invisible.
+
+    Parameters:
+        - element (element): The element to fade out.
+
+    Example usage:
+        def fade_text_out():
+            fade_out(text_to_hide)
+
+
+        text_to_hide = add_text("Text To Hide", 32)
+        position_element(text_to_hide, "center", 400)
+
+        fade_out_button = add_button("Fade Out")
+        position_element(fade_out_button, "center", "center")
+        click(fade_out_button, fade_text_out)
+    """
+
+    transition = _dom_writes.get_style(element, "transition")
+    if transition and "opacity 1s linear" not in transition:
+        _dom_writes.set_style(element, "transition", transition + ", opacity 1s linear")
+    else:
+        _dom_writes.set_style(element, "transition", "opacity 1s linear")
+
+    element.classList.remove("fade-in")
+    element.classList.add("fade-out")
+
+
+@_is_valid_element("_loop_animation")
+def _loop_animation(element, distance):
+    if element.animation_direction == "left":
+        element.animation_direction = "right"
+        _translate_x(element, distance)
+    elif element.animation_direction == "right":
+        element.animation_direction = "left"
+        _translate_x(element, -distance)
+    elif element.animation_direction == "up":
+        element.animation_direction = "down"
+        _translate_y(element, -distance)
+    elif element.animation_direction == "down":
+        element.animation_direction = "up"
+        _translate_y(element, distance)
+
+
+@_is_valid_element("_translate_x")
+def _translate_x(element, distance, time=None):
+    def _translate():
+        """We need this to ensure the transition is set before the transform."""
+        element.start_time = Date.now()
+        _dom_writes.set_style(element, "transform", f"translateX({distance}px)")
+
+    _defer_translate(element, _translate)
+
+
+@_is_valid_element("_translate_y")
+def _translate_y(element, distance):
+    def _translate():
+        element.start_time = Date.now()
+        _dom_writes.set_style(element, "transform", f"translateY({distance}px)")
+
+    _defer_translate(element, _translate)
+
+
+def _defer_translate(element, translate):
+    # If the game is paused before the frame comes, _pause() has already
+    # passed this element over, so it waits for the start button instead
+    key = _element_key(element)
+    _game_loop.defer(lambda: _start_gate.run(translate, key))
+
+
+@_is_valid_element("vanish")
+def vanish(element):
+    """
+    Removes the `element` from the page over a 1 second interval.
+
+    Parameters:
+        - element (element): The element to remove.
+
+    Example usage:
+        def vanish_taco():
+            vanish(taco_image)
+
+
+        taco_image = add_image("taco.jpg", 200)
+        position_element(taco_image, "center", 300)
+
+        vanish_taco_button = add_button("Vanish Taco")
+        position_element(vanish_taco_button, "center", "center")
+
+        click(vanish_taco_button, vanish_taco)
+    """
+
+    # Prevents spam clicking vanished elements.
+    _proxies.release(_element_key(element), "click")
+    
+    transition = _dom_writes.get_style(element, "transition")
+    if transition:
+        _dom_writes.set_style(element, "transition", transition + ", opacity 1s linear")
+    else:
+        _dom_writes.set_style(element, "transition", "opacity 1s linear")
+
+    _dom_writes.set_style(element, "opacity", "0")
+        
+    def cb():
+        _forget_element(element)
+        element.remove()
+
+    setTimeout(_proxies.once(cb), 2000)
+
+
+def _pause():
+    """
+    What the pause button does (see pause() in button_config.js): stops every
+    animating image where it is, and works out how far and for how long it
+    still has to go.
+    """
+
+    now = Date.now()
+    for key, element in _elements.by_kind["image"].items():
+        direction = element.animation_direction
+        # Not moving yet, so the start button still starts it
+        if not direction or element.start_time is None:
+            continue
+
+        left, top = _element_rect(element, key)[:2]
+        width = _dom_writes.get_style(element, "width", key)
+        _dom_writes.clear_styles(element, key)
+        _dom_writes.set_style(element, "position", "absolute", key)
+        _dom_writes.set_style(element, "top", f"{top}px", key)
+        _dom_writes.set_style(element, "left", f"{left}px", key)
+        _dom_writes.set_style(element, "width", width, key)
+
+        element.time -= (now - element.start_time) / 1000
+        element.start_time = None
+        if direction == "left":
+            element.distance_left = element.distance - (element.start_position - left)
+        elif direction == "right":
+            element.distance_left = element.distance - (left - element.start_position)
+        elif direction == "up":
+            element.distance_left = element.distance - (element.start_position - top)
+        elif direction == "down":
+            element.distance_left = element.distance - (top - element.start_position)
+        _paused[key] = element
+
+
+def _play():
+    """What the start button does after a pause: carries on where _pause() stopped."""
+
+    paused = list(_paused.items())
+    _paused.clear()
+    for key, element in paused:
+        _dom_writes.set_style(element, "transition", f"{element.time}s linear transform", key)
+        if element.animation_direction == "right":
+            _translate_x(element, element.distance_left)
+        elif element.animation_direction == "left":
+            _translate_x(element, -element.distance_left)
+        elif element.animation_direction == "up":
+            _translate_y(element, -element.distance_left)
+        elif element.animation_direction == "down":
+            _translate_y(element, element.distance_left)
+
+
+# key -> image stopped by _pause(), waiting for _play()
+_paused = {}
+_hooks["forget"].append(lambda key, pooled: _paused.pop(key, None))
+# The pause and play buttons in button_config.js call these
+window.mylibraryPause = _proxies.proxy(_pause)
+window.mylibraryPlay = _proxies.proxy(_play)
@@ -0,0 +1,372 @@
+"""Sound effects and background music, as <audio> elements or Web Audio."""
+
+from ._core import document, setTimeout, window, Date
+from ._core import _is_valid_element, _proxies, _element_key, _filename_not_found, _hooks, _start_gate, _ElementHandle
+
+
+def add_audio(filename, voices=1, min_interval=0):
+    """
+    Adds an audio file. For a sound effect that plays often, `voices` lets
+    that many copies of it play at once, so a new play doesn't cut off the
+    last one, and `min_interval` skips plays that come too soon after the
+    last one.
+
+    Parameters:
+        - filename (str): The filename.
+        - voices (int): How many copies can play at the same time (optional).
+        - min_interval (int): The least time (in seconds) between plays (optional).
+
+    Returns:
+        - The audio element.
+
+    Example usage:
+        audio_element = add_audio("never-gonna-give-you-up.mp3")
+        hit_sound = add_audio("hit.mp3", voices=4, min_interval=0.1)
+    """
+
+    if not isinstance(voices, int) or voices < 1:
+        raise Exception(
+            f"""
+Error in add_audio()
+    - '{voices}' is not a valid number of voices! Use a whole number of 1 or more.
+"""
+        )
+
+    if _web_audio is not None:
+        sound = _Sound(filename, voices)
+        _web_audio.load(filename, "add_audio")
+        _audio_voices[_element_key(sound)] = [[sound], 0, None, min_interval * 1000]
+        return sound
+
+    element = _ElementHandle(document.createElement("audio"), "AUDIO")
+    _proxies.listen(
+        element,
+        "error",
+        lambda _: _filename_not_found(filename, "add_audio"),
+        _element_key(element),
+        once=True,
+    )
+    element.src = filename
+    element.volume = _volumes["effects"]
+
+    document.body.appendChild(element.element)
+
+    # The extra voices share the first one's file (and its error listener)
+    # and don't need to be on the page to play
+    group = [element]
+    for _ in range(voices - 1):
+        voice = element.cloneNode()
+        voice.preload = "auto"
+        # Cloning copies attributes, and volume isn't one
+        voice.volume = _volumes["effects"]
+        group.append(voice)
+    _audio_voices[_element_key(element)] = [group, 0, None, min_interval * 1000]
+
+    return element
+
+
+# key -> [voices, index of the next voice, when it last played, min interval in ms]
+_audio_voices = {}
+# category -> volume, see set_volume()
+_volumes = {"music": 1, "effects": 1}
+_hooks["forget"].append(lambda key, pooled: _audio_voices.pop(key, None))
+
+
+class _Sound:
+    """
+    What add_audio() returns in "web_audio" mode (see set_audio_mode()). Each
+    play starts a cheap AudioBufferSourceNode on the file's decoded
+    AudioBuffer, so there's no media element to seek or restart. Up to
+    `voices` plays overlap before the oldest is cut off.
+    """
+
+    def __init__(self, filename, voices):
+        self.filename = filename
+        self.voices = voices
+        # [source node] for every play that hasn't ended
+        self.playing = []
+        self.waiting = False
+
+    @property
+    def paused(self):
+        return not self.playing
+
+    def play(self):
+        buffer = _web_audio.buffers.get(self.filename)
+        if buffer is None:
+            # Play it once the file has been decoded
+            if self.filename in _web_audio.waiting:
+                _web_audio.waiting[self.filename].add(self)
+            return
+        _web_audio.resume()
+
+        if len(self.playing) >= self.voices:
+            self.playing.pop(0)[0].stop()
+
+        source = _web_audio.context.createBufferSource()
+        source.buffer = buffer
+        source.connect(_web_audio.gains["effects"])
+        entry = [source]
+
+        def ended(_):
+            if entry in self.playing:
+                self.playing.remove(entry)
+
+        source.onended = _proxies.once(ended)
+        source.start()
+        self.playing.append(entry)
+
+    def pause(self):
+        playing, self.playing = self.playing, []
+        for entry in playing:
+            entry[0].stop()
+
+
+class _WebAudio:
+    """
+    The AudioContext behind "web_audio" mode. Every file is fetched and
+    decoded into an AudioBuffer once, however many add_audio() calls use it.
+    Effects and music go through their own gain node, see set_volume().
+    """
+
+    def __init__(self):
+        self.context = window.AudioContext.new()
+        self.gains = {}
+        for category in ("music", "effects"):
+            gain = self.context.createGain()
+            gain.gain.value = _volumes[category]
+            gain.connect(self.context.destination)
+            self.gains[category] = gain
+
+        # filename -> AudioBuffer, once decoded
+        self.buffers = {}
+        # filename -> sounds to play as soon as it's decoded
+        self.waiting = {}
+
+        # Browsers only let audio start after the player interacts with the page
+        _proxies.listen(document.body, "click", lambda _: self.resume(), once=True)
+
+    def resume(self):
+        if self.context.state == "suspended":
+            self.context.resume()
+
+    def load(self, filename, function_name):
+        if filename in self.buffers or filename in self.waiting:
+            return
+        self.waiting[filename] = set()
+
+        # Only one of the last two callbacks runs, and after a failure the
+        # ones before it may not have, so they're all destroyed together
+        owner = ("web_audio", filename)
+
+        def fetched(response):
+            return response.arrayBuffer() if response.ok else None
+
+        def decode(data):
+            return None if data is None else self.context.decodeAudioData(data)
+
+        def settled(buffer):
+            _proxies.release(owner)
+            sounds = self.waiting.pop(filename)
+            if buffer is None:
+                _filename_not_found(filename, function_name)
+            self.buffers[filename] = buffer
+            for sound in sounds:
+                sound.play()
+
+        window.fetch(filename).then(_proxies.once(fetched, owner)).then(
+            _proxies.once(decode, owner)
+        ).then(
+            _proxies.once(settled, owner),
+            _proxies.once(lambda _: settled(None), owner),
+        )
+
+    def connect_music(self, element):
+        self.context.createMediaElementSource(element).connect(self.gains["music"])
+
+
+# The AudioContext for "web_audio" mode, see set_audio_mode()
+_web_audio = None
+
+
+def add_background_audio(filename, load="play"):
+    """
+    Adds background audio which plays when you click the "Start" button.
+    Music files are big, so it isn't downloaded while the page is loading:
+    it starts downloading when "Start" is clicked (or with load="idle", as
+    soon as the browser has nothing else to do) and plays as soon as enough
+    of it has arrived.
+
+    Parameters:
+        - filename (str): The filename.
+        - load (str): When to start downloading, "play" or "idle" (optional).
+
+    Example usage:
+        add_background_audio("never-gonna-give-you-up.mp3")
+    """
+
+    if load not in ("play", "idle"):
+        raise Exception(
+            f"""
+Error in add_background_audio()
+    - '{load}' is not a valid time to load! Use "play" or "idle".
+"""
+        )
+
+    element = document.createElement("audio")
+    _proxies.listen(
+        element,
+        "error",
+        lambda _: _filename_not_found(filename, "add_background_audio"),
+        once=True,
+    )
+
+    # button_config.js sets src from data-src when the game starts
+    element.preload = "none"
+    element.setAttribute("data-src", filename)
+    element.id = "bg-music"
+    element.loop = True
+
+    if load == "idle":
+        def load_music(*_):
+            if not element.getAttribute("src"):
+                element.preload = "auto"
+                element.src = filename
+
+        request_idle = getattr(window, "requestIdleCallback", None)
+        if request_idle is not None:
+            request_idle(_proxies.once(load_music))
+        else:
+            setTimeout(_proxies.once(load_music), 3000)
+
+    document.body.appendChild(element)
+
+    # Long music streams from the element either way, but in "web_audio" mode
+    # it's mixed through the music gain node
+    if _web_audio is not None:
+        _web_audio.connect_music(element)
+    else:
+        element.volume = _volumes["music"]
+
+
+@_is_valid_element("play_audio")
+def play_audio(element):
+    """
+    Plays the audio that `element` represents.
+
+    Parameters:
+        - element (element): The audio element to play.
+
+    Example usage:
+
+        laugh_audio = add_audio("laugh.mp3")
+        play_audio(laugh_audio)
+    """
+
+    key = _element_key(element)
+    voices = _audio_voices.get(key)
+    voice = element
+    if voices is not None:
+        group, index, last_played, min_interval = voices
+        now = Date.now()
+        if last_played is not None and now - last_played < min_interval:
+            return
+        voices[2] = now
+
+        # Use the next voice that has finished, or else cut off the oldest
+        for offset in range(len(group)):
+            if group[(index + offset) % len(group)].paused:
+                index = (index + offset) % len(group)
+                break
+        voice = group[index]
+        voices[1] = (index + 1) % len(group)
+
+    # A _Sound mixes its own voices
+    if not isinstance(voice, _Sound) and not voice.paused:
+        voice.pause()
+        voice.currentTime = 0
+
+    # Play the sound once the start button has been pressed, or now if it has
+    _start_gate.run(lambda: voice.play(), key)
+
+
+def set_audio_mode(mode):
+    """
+    Chooses how add_audio() plays sounds. In "element" mode (the default)
+    every sound is an <audio> element. In "web_audio" mode every file is
+    decoded once and played through the Web Audio API instead, which starts
+    sounds faster and plays many at once more cheaply. play_audio() and
+    set_volume() work the same in both modes. Call this before adding audio.
+
+    Parameters:
+        - mode (str): "element" or "web_audio".
+
+    Example usage:
+        set_audio_mode("web_audio")
+        laugh_audio = add_audio("laugh.mp3", voices=4)
+        play_audio(laugh_audio)
+    """
+
+    global _web_audio
+
+    if mode not in ("element", "web_audio"):
+        raise Exception(
+            f"""
+Error in set_audio_mode()
+    - '{mode}' is not a valid audio mode! Use "element" or "web_audio".
+"""
+        )
+
+    if mode == "element":
+        _web_audio = None
+    elif _web_audio is None:
+        if getattr(window, "AudioContext", None) is None:
+            raise Exception(
+                """
+Error in set_audio_mode()
+    - This browser doesn't support "web_audio" mode!
+"""
+            )
+        _web_audio = _WebAudio()
+
+
+def set_volume(category, volume):
+    """
+    Sets the volume of the background music or of every other sound.
+
+    Parameters:
+        - category (str): "music" or "effects".
+        - volume (float): From 0 (silent) to 1 (full volume).
+
+    Example usage:
+        set_volume("music", 0.3)
+    """
+
+    if category not in _volumes:
+        raise Exception(
+            f"""
+Error in set_volume()
+    - '{category}' is not a valid category! Use "music" or "effects".
+"""
+        )
+    if not isinstance(volume, (int, float)) or not 0 <= volume <= 1:
+        raise Exception(
+            f"""
+Error in set_volume()
+    - '{volume}' is not a valid volume! Use a number from 0 to 1.
+"""
+        )
+
+    _volumes[category] = volume
+    if _web_audio is not None:
+        _web_audio.gains[category].gain.value = volume
+        return
+
+    if category == "music":
+        music = document.getElementById("bg-music")
+        if music:
+            music.volume = volume
+    else:
+        for group in _audio_voices.values():
+            for voice in group[0]:
+                voice.volume = volume
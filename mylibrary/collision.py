@@ -0,0 +1,288 @@
+"""check_collision() and the SpatialHash it uses."""
+
+from ._core import Timer, _element_key, _element_rect, _element_motion, _has_left_canvas, _handle, _hooks
+from .images import _image_sources, _release_image
+
+
+def check_collision(element1, element2, function_to_run):
+    """
+    If element1 and element2 collide, function_to_run is called.
+
+    Parameters:
+        - element1 (element): An element to check for collisions with.
+        - element2 (element): An element to check for collisions with.
+        - function_to_run (function): The function to run if element1 hits element2.
+
+    Example usage:
+        def cat_caught_taco():
+            clear()
+            text = add_text("The kitty caught the taco!")
+            position_element(text, "center", "center")
+
+
+        taco_image = add_image("taco.jpg", 100)
+        cat_image = add_image("flying-cats.jpg", 100)
+
+        check_collision(taco_image, cat_image, cat_caught_taco)
+    """
+
+    _collision_engine.add_pair(_handle(element1), _handle(element2), function_to_run)
+
+
+def _collision(a, b):
+    return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+
+class _CollisionEngine:
+    """
+    Checks every pair registered with check_collision() from one shared
+    interval instead of one interval per pair. Each tick works out every
+    element's rect once (see _element_rect) and updates it in a SpatialHash,
+    then each element with pairs only tests the elements in the grid cells
+    around it.
+    """
+
+    def __init__(self, tick_rate=50, cell_size=100):
+        self.tick_rate = tick_rate
+        self.grid = SpatialHash(cell_size)
+        # (key1, key2) -> list of functions to run when that pair overlaps
+        self.pairs = {}
+        # key -> [element, set of keys it is paired with]
+        self.elements = {}
+        self.timer = None
+        self.ticks = 0
+
+    def add_pair(self, element1, element2, function_to_run):
+        key1 = _element_key(element1)
+        key2 = _element_key(element2)
+        self.elements.setdefault(key1, [element1, set()])[1].add(key2)
+        self.elements.setdefault(key2, [element2, set()])[1].add(key1)
+
+        self.pairs.setdefault(_pair_key(key1, key2), []).append(function_to_run)
+        self.start()
+
+    def remove_element(self, key):
+        """Forgets every pair that uses the element with `key`."""
+        entry = self.elements.pop(key, None)
+        if entry is None:
+            return
+        self.grid.remove(entry[0], key)
+
+        for other in entry[1]:
+            self.pairs.pop(_pair_key(key, other), None)
+            partner = self.elements.get(other)
+            if partner is not None:
+                partner[1].discard(key)
+                if not partner[1]:
+                    self.remove_element(other)
+
+    def start(self):
+        # clear() cancels the timer, so the next check_collision() restarts it
+        if self.timer is not None and self.timer.active:
+            return
+        self.timer = Timer(self.tick, self.tick_rate / 1000, repeat=True)
+
+    def tick(self):
+        self.ticks += 1
+        gone = []
+        for key, entry in self.elements.items():
+            rect, direction, progress = _element_motion(entry[0], key)
+            if key in _image_sources and _has_left_canvas(rect, direction, progress):
+                gone.append((entry[0], key))
+            else:
+                self.grid.update(entry[0], rect, key)
+
+        for element, key in gone:
+            _release_image(element, key)
+
+        # Query from the elements with the most partners first (the wizard),
+        # so that an enemy whose only partner was already queried is skipped.
+        done = set()
+        hits = []
+        order = sorted(self.elements, key=lambda key: -len(self.elements[key][1]))
+        for key in order:
+            partners = self.elements[key][1]
+            if partners <= done:
+                done.add(key)
+                continue
+            for other in self.grid.query_keys(key):
+                if other in partners and other not in done:
+                    hits.append(_pair_key(key, other))
+            done.add(key)
+
+        for pair in hits:
+            for function_to_run in list(self.pairs.get(pair, ())):
+                function_to_run()
+
+
+class SpatialHash:
+    """
+    A uniform grid that indexes elements by the cells their rect covers, so
+    "which elements overlap this one?" only looks at nearby elements.
+
+    Parameters:
+        - cell_size (int): The width and height of each grid cell (in pixels).
+
+    Counters:
+        - occupancy(): How many elements and non-empty cells are indexed.
+        - last_candidates: Elements tested by the most recent query.
+        - total_candidates / queries: Running totals across every query.
+
+    Example usage:
+        enemies = SpatialHash(100)
+        enemies.insert(bat_image)
+        enemies.update(bat_image)  # after the bat has moved
+        for enemy in enemies.query(wizard_image):
+            remove_element(enemy)
+    """
+
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        # (column, row) -> set of keys whose rect touches that cell
+        self.cells = {}
+        # key -> [element, rect, (first column, first row, last column, last row)]
+        self.items = {}
+        self.last_candidates = 0
+        self.total_candidates = 0
+        self.queries = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, element):
+        return _element_key(element) in self.items
+
+    def _cell_span(self, rect):
+        size = self.cell_size
+        return (
+            int(rect[0] // size),
+            int(rect[1] // size),
+            int(rect[2] // size),
+            int(rect[3] // size),
+        )
+
+    def _add_to_cells(self, key, span):
+        for column in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                self.cells.setdefault((column, row), set()).add(key)
+
+    def _remove_from_cells(self, key, span):
+        for column in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                cell = self.cells.get((column, row))
+                if cell is not None:
+                    cell.discard(key)
+                    if not cell:
+                        del self.cells[(column, row)]
+
+    def insert(self, element, rect=None, key=None):
+        """
+        Adds `element` to the index. `rect` is (left, top, right, bottom) and
+        is read from the page if it isn't given.
+        """
+        self.update(element, rect, key)
+
+    def update(self, element, rect=None, key=None):
+        """
+        Moves `element` to the cells its current rect covers. Cheap when the
+        element is still inside the same cells.
+        """
+        if key is None:
+            key = _element_key(element)
+        if rect is None:
+            rect = _element_rect(element, key)
+        span = self._cell_span(rect)
+
+        item = self.items.get(key)
+        if item is None:
+            self.items[key] = [element, rect, span]
+            self._add_to_cells(key, span)
+            return
+
+        item[1] = rect
+        if item[2] != span:
+            self._remove_from_cells(key, item[2])
+            self._add_to_cells(key, span)
+            item[2] = span
+
+    def remove(self, element, key=None):
+        """Removes `element` from the index, if it's there."""
+        if key is None:
+            key = _element_key(element)
+        item = self.items.pop(key, None)
+        if item is not None:
+            self._remove_from_cells(key, item[2])
+
+    def query_keys(self, key):
+        """Keys of the indexed elements that overlap the element with `key`."""
+        item = self.items.get(key)
+        if item is None:
+            return []
+        rect, span = item[1], item[2]
+
+        candidates = set()
+        for column in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    candidates.update(cell)
+        candidates.discard(key)
+
+        self.queries += 1
+        self.last_candidates = len(candidates)
+        self.total_candidates += len(candidates)
+
+        return [other for other in candidates if _collision(rect, self.items[other][1])]
+
+    def query(self, element):
+        """
+        Returns the indexed elements whose rect overlaps `element`. The
+        element is indexed (or updated) first.
+        """
+        key = _element_key(element)
+        self.update(element, None, key)
+        return [self.items[other][0] for other in self.query_keys(key)]
+
+    def occupancy(self):
+        """
+        Returns a dict with the number of indexed elements, the number of
+        non-empty cells and the most elements found in a single cell.
+        """
+        return {
+            "elements": len(self.items),
+            "cells": len(self.cells),
+            "max_per_cell": max((len(cell) for cell in self.cells.values()), default=0),
+        }
+
+    def set_cell_size(self, cell_size):
+        """Changes the cell size and re-buckets every indexed element."""
+        self.cell_size = cell_size
+        self.cells = {}
+        for key, item in self.items.items():
+            item[2] = self._cell_span(item[1])
+            self._add_to_cells(key, item[2])
+
+
+def get_collision_index():
+    """
+    Returns the SpatialHash that check_collision() uses, so you can change its
+    cell size or read its counters.
+
+    Returns:
+        - The SpatialHash used for collision checks.
+
+    Example usage:
+        index = get_collision_index()
+        index.set_cell_size(150)
+        print(index.occupancy(), index.last_candidates)
+    """
+
+    return _collision_engine.grid
+
+
+_collision_engine = _CollisionEngine()
+_hooks["forget"].append(lambda key, pooled: _collision_engine.remove_element(key))
+
+
+def _pair_key(key1, key2):
+    return (key1, key2) if key1 < key2 else (key2, key1)
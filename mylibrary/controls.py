@@ -0,0 +1,145 @@
+"""Clicks, the keyboard and input()."""
+
+from ._core import document, prompt, Timer, _is_valid_element, _proxies, _element_key, _start_gate
+
+
+@_is_valid_element("click")
+def click(element, function_to_run):
+    """
+    Call `function_to_run` when `element` is clicked.
+
+    Parameters:
+        - element (element): The element to click.
+        - function_to_run (function): The function to run if `element` is clicked.
+
+    Example usage:
+        def show_text():
+            text = add_text("Button was clicked!", 32)
+            position_element(text, "center", "center")
+
+
+        button = add_button("Click Me")
+        position_element(button, "center", 400)
+
+        click(button, show_text)
+    """
+
+    if not callable(function_to_run):
+        raise Exception(
+            """
+Error in click()
+    - The second argument is not a function!
+"""
+        )
+
+    def click_handler(event):
+        # Note that this will use __code__.co_argcount for TAM
+        if function_to_run.__code__.co_argcount:
+            # The handle add_*() returned rather than the page's element
+            function_to_run(element)
+        else:
+            function_to_run()
+
+    # Owned by the element so vanish() can remove it to prevent spam clicks
+    _proxies.listen(element, "click", click_handler, _element_key(element))
+
+
+def input(s):
+    return prompt(s)
+
+
+def keydown(function_to_run, fast=False):
+    """
+    Wrapper for more specific keydown functions.
+    Passes `function_to_run` to `_keydown` or `_keydown_fast` based on the boolean flag `fast` parameter.
+    """
+    if not callable(function_to_run):
+        raise Exception(
+            """
+Error in keydown()
+    - The first argument is not a function!
+"""
+        )
+    if type(fast) != bool:
+        raise Exception(
+            """
+Error in keydown()
+    - The second argument is not a boolean!
+"""
+        )
+    if fast:
+        _keydown_fast(function_to_run)
+    else:
+        _keydown(function_to_run)
+
+
+def _keydown(function_to_run):
+    """
+    Runs `function_to_run` when a key is pressed using a standard `keydown` event listenter. The key that is pressed will
+    be passed as the first argument to `function_to_run` and will always be
+    lowercase.
+
+    Parameters:
+        - function_to_run (function): The function to run when a key is pressed.
+
+    Example usage:
+        def key_logger(pressed_key):
+            update_text(last_key_pressed_text, f"Last key pressed: {pressed_key}")
+
+
+        last_key_pressed_text = add_text("Last key pressed: ", 32)
+        position_element(last_key_pressed_text, "center", 400)
+
+        keydown(key_logger)
+    """
+
+    def keydown_listener(event):
+        # Keys do nothing until the game has started, or while it's paused
+        if not _start_gate.waiting:
+            function_to_run(event.key.lower())
+    
+    _proxies.listen(document.body, "keydown", keydown_listener)
+
+
+def _keydown_fast(function_to_run):
+    """
+    Called by keydown when the second argument is `True`.
+    Runs `function_to_run` when a key is pressed using a standard `keydown` event listener. The key that is pressed will
+    be passed as the first argument to `function_to_run` and will always be
+    lowercase.
+
+    Parameters:
+        - function_to_run (function): The function to run when a key is pressed.
+
+    Example usage:
+        def move(key):
+           if key == "d":
+               move_right(wizard, 5)
+
+
+        wizard = add_image("wizard.png", 100)
+        keydown(move, True)
+    """
+    # clear() cancels the tick timer, after which keydown() can start a new one
+    if getattr(_keydown_fast, "_tick_timer", None) and _keydown_fast._tick_timer.active:
+        return
+
+    tickrate = 40
+
+    def keydown_listener(event):
+        _keydown_fast._keys_down[event.key] = True
+
+    def keyup_listener(event):
+        if event.key in _keydown_fast._keys_down:
+            del _keydown_fast._keys_down[event.key]
+
+    def tick():
+        for key in _keydown_fast._keys_down:
+            function_to_run(key.lower())
+
+    if not hasattr(_keydown_fast, "_keys_down"):
+        _keydown_fast._keys_down = {}
+        _proxies.listen(document.body, "keydown", keydown_listener)
+        _proxies.listen(document.body, "keyup", keyup_listener)
+
+    _keydown_fast._tick_timer = Timer(tick, tickrate / 1000, repeat=True)
@@ -0,0 +1,258 @@
+"""EntityStore: lots of boxes moving in straight lines, kept as arrays."""
+
+from array import array
+
+from ._core import _dom_writes, _element_rect, _canvas_size
+
+try:
+    import numpy as _np
+except ImportError:
+    # Pyodide only has NumPy after pyodide.loadPackage("numpy")
+    _np = None
+
+
+class EntityStore:
+    """
+    Keeps many things that are all alike, such as enemies flying across the
+    screen, as columns of numbers instead of one element each: their
+    positions, velocities (in pixels per second) and sizes. update() moves
+    every entity in one step, and overlapping() tests every entity against
+    one box at once. With NumPy each of those is a single vectorized
+    operation. Without it the columns are `array` module arrays, looped over
+    in Python.
+
+    Entities can have an element (e.g. from add_image()) that draw() moves
+    to where the entity is.
+
+    Parameters:
+        - capacity (int): How many entities to make room for at first (optional).
+        - use_numpy (bool): Whether to use NumPy if it's installed (optional).
+
+    Example usage:
+        bats = EntityStore()
+
+        def spawn_bat():
+            bat = add_image("bat.gif", 75)
+            bats.add(-100, randint(0, 500), 120, 0, 75, 75, bat)
+
+        def tick(dt):
+            bats.update(dt)
+            if bats.overlapping(wizard):
+                lose_health()
+            for entity in bats.departed():
+                remove_element(bats.element(entity))
+                bats.remove(entity)
+            bats.draw()
+
+        set_interval(spawn_bat, 1)
+        on_update(tick)
+    """
+
+    def __init__(self, capacity=64, use_numpy=True):
+        self.numpy = use_numpy and _np is not None
+        self.capacity = max(int(capacity), 1)
+        self.count = 0
+        if self.numpy:
+            # One row per entity: (x, y), (vx, vy) and (width, height)
+            self.positions = _np.zeros((self.capacity, 2))
+            self.velocities = _np.zeros((self.capacity, 2))
+            self.sizes = _np.zeros((self.capacity, 2))
+            self.ids = _np.zeros(self.capacity, dtype=_np.int64)
+        else:
+            # x0, y0, x1, y1, ... and the same for velocities and sizes
+            self.positions = array("d", bytes(16 * self.capacity))
+            self.velocities = array("d", bytes(16 * self.capacity))
+            self.sizes = array("d", bytes(16 * self.capacity))
+            self.ids = array("q", bytes(8 * self.capacity))
+        # Element (or None) for each row
+        self.elements = []
+        # entity id -> row
+        self.rows = {}
+        self.next_id = 1
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, entity):
+        return entity in self.rows
+
+    def _grow(self):
+        extra = self.capacity
+        self.capacity *= 2
+        if self.numpy:
+            for name in ("positions", "velocities", "sizes", "ids"):
+                old = getattr(self, name)
+                new = _np.zeros((self.capacity,) + old.shape[1:], dtype=old.dtype)
+                new[: self.count] = old[: self.count]
+                setattr(self, name, new)
+        else:
+            for column in (self.positions, self.velocities, self.sizes):
+                column.frombytes(bytes(16 * extra))
+            self.ids.frombytes(bytes(8 * extra))
+
+    def add(self, x, y, vx=0, vy=0, width=0, height=0, element=None):
+        """
+        Adds an entity with its top left corner at (`x`, `y`), moving `vx`
+        and `vy` pixels per second.
+
+        Returns:
+            - The entity's id, for remove(), position() and the rest.
+        """
+
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        entity = self.next_id
+        self.next_id += 1
+        self._write(row, x, y, vx, vy, width, height, entity)
+        self.elements.append(element)
+        self.rows[entity] = row
+        self.count += 1
+        return entity
+
+    def _write(self, row, x, y, vx, vy, width, height, entity):
+        if self.numpy:
+            self.positions[row] = (x, y)
+            self.velocities[row] = (vx, vy)
+            self.sizes[row] = (width, height)
+        else:
+            self.positions[2 * row : 2 * row + 2] = array("d", (x, y))
+            self.velocities[2 * row : 2 * row + 2] = array("d", (vx, vy))
+            self.sizes[2 * row : 2 * row + 2] = array("d", (width, height))
+        self.ids[row] = entity
+
+    def remove(self, entity):
+        """Removes the entity. The last row moves into its place."""
+        row = self.rows.pop(entity)
+        last = self.count - 1
+        if row != last:
+            moved = int(self.ids[last])
+            if self.numpy:
+                for column in (self.positions, self.velocities, self.sizes):
+                    column[row] = column[last]
+            else:
+                for column in (self.positions, self.velocities, self.sizes):
+                    column[2 * row : 2 * row + 2] = column[2 * last : 2 * last + 2]
+            self.ids[row] = moved
+            self.elements[row] = self.elements[last]
+            self.rows[moved] = row
+        self.elements.pop()
+        self.count = last
+
+    def clear(self):
+        """Removes every entity."""
+        self.count = 0
+        self.elements = []
+        self.rows = {}
+
+    def position(self, entity):
+        """Returns the (x, y) of the entity's top left corner."""
+        row = self.rows[entity]
+        if self.numpy:
+            return tuple(self.positions[row].tolist())
+        return self.positions[2 * row], self.positions[2 * row + 1]
+
+    def set_velocity(self, entity, vx, vy):
+        """Changes how many pixels per second the entity moves."""
+        row = self.rows[entity]
+        if self.numpy:
+            self.velocities[row] = (vx, vy)
+        else:
+            self.velocities[2 * row : 2 * row + 2] = array("d", (vx, vy))
+
+    def element(self, entity):
+        """Returns the element given to add() for the entity, or None."""
+        return self.elements[self.rows[entity]]
+
+    def update(self, dt):
+        """Moves every entity by its velocity times `dt` seconds."""
+        if self.numpy:
+            count = self.count
+            self.positions[:count] += self.velocities[:count] * dt
+            return
+        positions, velocities = self.positions, self.velocities
+        for index in range(2 * self.count):
+            positions[index] += velocities[index] * dt
+
+    def overlapping(self, rect):
+        """
+        Returns the ids of the entities that overlap `rect`, which is a
+        (left, top, right, bottom) tuple or an element like the player's.
+        """
+
+        if not isinstance(rect, tuple):
+            rect = _element_rect(rect)
+        left, top, right, bottom = rect
+
+        if self.numpy:
+            count = self.count
+            x, y = self.positions[:count, 0], self.positions[:count, 1]
+            width, height = self.sizes[:count, 0], self.sizes[:count, 1]
+            hits = (x < right) & (x + width > left) & (y < bottom) & (y + height > top)
+            return self.ids[:count][hits].tolist()
+
+        positions, sizes, ids = self.positions, self.sizes, self.ids
+        found = []
+        for row in range(self.count):
+            x, y = positions[2 * row], positions[2 * row + 1]
+            if x < right and x + sizes[2 * row] > left and y < bottom and y + sizes[2 * row + 1] > top:
+                found.append(ids[row])
+        return found
+
+    def departed(self, rect=None):
+        """
+        Returns the ids of the entities that are outside `rect` (the canvas
+        if it isn't given) and aren't moving back towards it, so they will
+        never be seen again.
+        """
+
+        if rect is None:
+            rect = (0, 0) + tuple(_canvas_size())
+        left, top, right, bottom = rect
+
+        if self.numpy:
+            count = self.count
+            x, y = self.positions[:count, 0], self.positions[:count, 1]
+            vx, vy = self.velocities[:count, 0], self.velocities[:count, 1]
+            width, height = self.sizes[:count, 0], self.sizes[:count, 1]
+            gone = (
+                ((x + width <= left) & (vx <= 0))
+                | ((x >= right) & (vx >= 0))
+                | ((y + height <= top) & (vy <= 0))
+                | ((y >= bottom) & (vy >= 0))
+            )
+            return self.ids[:count][gone].tolist()
+
+        positions, velocities, sizes, ids = self.positions, self.velocities, self.sizes, self.ids
+        found = []
+        for row in range(self.count):
+            x, y = positions[2 * row], positions[2 * row + 1]
+            vx, vy = velocities[2 * row], velocities[2 * row + 1]
+            if (
+                (x + sizes[2 * row] <= left and vx <= 0)
+                or (x >= right and vx >= 0)
+                or (y + sizes[2 * row + 1] <= top and vy <= 0)
+                or (y >= bottom and vy >= 0)
+            ):
+                found.append(ids[row])
+        return found
+
+    def draw(self):
+        """
+        Moves each entity's element to where the entity is. Only changed
+        positions are written, and with batch_writes(buffer=True) they all
+        go to the page in one call.
+        """
+
+        if self.numpy:
+            coordinates = self.positions[: self.count].tolist()
+        else:
+            coordinates = [
+                (self.positions[2 * row], self.positions[2 * row + 1]) for row in range(self.count)
+            ]
+        for element, (x, y) in zip(self.elements, coordinates):
+            if element is None:
+                continue
+            _dom_writes.set_style(element, "position", "absolute")
+            _dom_writes.set_style(element, "left", f"{round(x)}px")
+            _dom_writes.set_style(element, "top", f"{round(y)}px")
@@ -0,0 +1,770 @@
+"""Images, backgrounds, sprite atlases and the canvas rendering mode."""
+
+from types import SimpleNamespace
+import json
+import math
+import re
+
+from ._core import document, window, Date, Promise, to_js, open_url
+from ._core import (
+    _proxies,
+    _dom_writes,
+    _elements,
+    _ElementHandle,
+    _element_key,
+    _element_rect,
+    _element_motion,
+    _has_left_canvas,
+    _canvas_size,
+    _px,
+    _filename_not_found,
+    _forget_element,
+    _game_loop,
+    _hooks,
+)
+
+
+def add_background(filename):
+    """
+    Adds a background image.
+
+    Parameters:
+        - filename (str): The filename.
+
+    Example usage:
+        add_background("flying-cats.png")
+    """
+
+    element = document.createElement("img")
+    _proxies.listen(
+        element,
+        "error",
+        lambda _: _filename_not_found(filename, "add_background"),
+        once=True,
+    )
+    element.src = filename
+
+    canvas = document.getElementById("canvas")
+
+    if canvas:
+        canvas.style.backgroundImage = f"url({filename})"
+    else:
+        document.querySelector("html").style.backgroundImage = f"url({filename})"
+
+
+def add_image(filename, size=None):
+    """
+    Adds an image to the page.
+
+    An image that animates off the canvas is taken off the page and given
+    out again by a later add_image() of the same file and size, so don't
+    keep using an image once it has left the canvas.
+
+    Parameters:
+        - filename (str): The filename.
+        - size (int): The size, in pixels (optional).
+
+    Returns:
+        - The image element.
+
+    Example usage:
+        taco_image = add_image("taco.png")
+    """
+
+    pool = _image_pool.get((filename, size))
+    if pool:
+        # Reuse a sprite that has animated off the canvas. It has already
+        # loaded this file, so there's no new request or error listener.
+        element = pool.pop()
+    elif _renderer is not None:
+        element = _Sprite(_renderer.bitmap(filename))
+    else:
+        # A clone shares the template's request and decoded image, and the
+        # template's error listener covers it
+        element = _ElementHandle(_image_template(filename).cloneNode(), "IMG")
+
+    if size:
+        _dom_writes.set_style(element, "width", str(size) + "px")
+
+    canvas = document.getElementById("canvas")
+
+    if _renderer is not None:
+        _renderer.add(element)
+    elif canvas:
+        _dom_writes.append(canvas, element)
+        _watch_transitions(canvas)
+    else:
+        _dom_writes.append(document.body, element)
+    if _renderer is None:
+        _elements.add(element, "image")
+
+    _image_sources[_element_key(element)] = (filename, size)
+
+    return element
+
+
+def _image_template(filename):
+    """
+    Returns the <img> that add_image() clones for `filename`. It's made the
+    first time it's needed (or by preload_assets()) and never goes on the page.
+    """
+
+    template = _image_templates.get(filename)
+    if template is None and filename in _atlas_frames:
+        # An atlas frame is a blank image with the atlas as its background,
+        # see load_atlas()
+        template = document.createElement("img")
+        template.classList.add(_atlas_frames[filename][1])
+        template.src = _BLANK_IMAGE
+        _image_templates[filename] = template
+    elif template is None:
+        template = document.createElement("img")
+        _proxies.listen(
+            template,
+            "error",
+            lambda _: _filename_not_found(filename, "add_image"),
+            once=True,
+        )
+        template.src = filename
+        _image_templates[filename] = template
+    return template
+
+
+# filename -> the <img> every add_image() of that file is cloned from
+_image_templates = {}
+# A transparent 1x1 GIF
+_BLANK_IMAGE = "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+# key -> (filename, size) for every image that add_image() can reuse
+_image_sources = {}
+# (filename, size) -> detached images waiting to be reused by add_image()
+_image_pool = {}
+
+
+def _release_image(element, key):
+    """
+    Takes an image that has animated off the canvas out of the page and out of
+    collision checks, and keeps it for the next add_image() of the same file.
+    """
+
+    _forget_element(element, key, pooled=True)
+    element.remove()
+
+    _dom_writes.clear_styles(element, key)
+    element.onload = None
+    element.animation_direction = None
+    element.start_time = None
+    element.loop_animation = False
+
+    _image_pool.setdefault(_image_sources[key], []).append(element)
+
+
+def _watch_transitions(canvas):
+    """
+    Listens for transitionend on the canvas once, so images that finish an
+    animation off the canvas are released without a listener per image.
+    """
+
+    global _transition_listener
+    if _transition_listener is not None:
+        return
+    _transition_listener = _proxies.listen(canvas, "transitionend", _on_transition_end)
+
+
+_transition_listener = None
+
+
+def _on_transition_end(event):
+    element = event.target
+    if event.propertyName != "transform":
+        return
+    key = getattr(element, "mylibrary_key", None)
+    if key is None or key not in _image_sources:
+        return
+    element = _elements.get(key, element)
+    rect, direction, progress = _element_motion(element, key)
+    if _has_left_canvas(rect, direction, progress):
+        _release_image(element, key)
+
+
+class _Sprite:
+    """
+    What add_image() returns in "canvas" rendering mode (see
+    set_rendering_mode()): a Python stand-in for an <img> that _SpriteRenderer
+    draws onto one <canvas> each frame. It has the parts of an element that
+    mylibrary uses, so the rest of the library treats it like any image. Its
+    transform and opacity transitions are played out against Date.now().
+    """
+
+    tagName = "IMG"
+
+    def __init__(self, bitmap):
+        # [image, (natural width, natural height) once loaded], shared by
+        # every sprite of the same file
+        self.bitmap = bitmap
+        self.style = _SpriteStyle(self)
+        self.classList = _SpriteClassList(self)
+        self.listeners = {}
+        self.onload = None
+        # "transform" or "opacity" -> (start value, end value, start time, duration in ms)
+        self.transitions = {}
+        self.offset = (0, 0)
+        self.angle = 0
+        self.opacity = 1
+
+    # Layout, in canvas coordinates like the <img> it replaces
+
+    def _size(self):
+        natural = _renderer.natural_size(self.bitmap)
+        if natural is None:
+            return 0, 0
+        width = _px(self.style.width)
+        if width is None:
+            return natural
+        return width, width * natural[1] / natural[0]
+
+    @property
+    def offsetWidth(self):
+        return self._size()[0]
+
+    @property
+    def offsetHeight(self):
+        return self._size()[1]
+
+    @property
+    def offsetLeft(self):
+        left = _px(self.style.left)
+        if left is not None:
+            return left
+        align = self.style.alignSelf
+        if align == "center":
+            return (_canvas_size()[0] - self.offsetWidth) / 2
+        if align == "flex-end":
+            return _canvas_size()[0] - self.offsetWidth
+        return 0
+
+    @property
+    def offsetTop(self):
+        return _px(self.style.top) or 0
+
+    def getBoundingClientRect(self):
+        canvas_rect = _renderer.canvas.getBoundingClientRect()
+        x, y = self._value_at("transform", Date.now())
+        width, height = self._size()
+        return SimpleNamespace(
+            left=canvas_rect.left + self.offsetLeft + x,
+            top=canvas_rect.top + self.offsetTop + y,
+            width=width,
+            height=height,
+        )
+
+    def remove(self):
+        if _renderer is not None:
+            _renderer.remove(self)
+
+    # Events
+
+    def addEventListener(self, event_type, listener):
+        self.listeners.setdefault(event_type, []).append(listener)
+        if event_type == "click" and _renderer is not None:
+            _renderer.listen_for_clicks()
+
+    def removeEventListener(self, event_type, listener):
+        listeners = self.listeners.get(event_type, [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def dispatchEvent(self, event):
+        for listener in list(self.listeners.get(event.type, ())):
+            listener(event)
+
+    # Transitions
+
+    def _value_at(self, name, now):
+        transition = self.transitions.get(name)
+        if transition is None:
+            return self.offset if name == "transform" else self.opacity
+        start, end, start_time, duration = transition
+        progress = min((now - start_time) / duration, 1)
+        if name == "transform":
+            return (
+                start[0] + (end[0] - start[0]) * progress,
+                start[1] + (end[1] - start[1]) * progress,
+            )
+        return start + (end - start) * progress
+
+    def _transition_to(self, name, value):
+        now = Date.now()
+        current = self._value_at(name, now)
+        match = re.search(r"([\d.]+)s linear " + name, self.style.transition)
+        if match and float(match.group(1)) > 0 and value != current:
+            self.transitions[name] = (current, value, now, float(match.group(1)) * 1000)
+        else:
+            self.transitions.pop(name, None)
+        if name == "transform":
+            self.offset = value
+        else:
+            self.opacity = value
+
+    def _set_transform(self, value):
+        offset = [0.0, 0.0]
+        self.angle = 0
+        for function, amount in re.findall(r"(translateX|translateY|rotate)\((-?[\d.]+)", value):
+            if function == "rotate":
+                self.angle = float(amount)
+            else:
+                offset[function == "translateY"] = float(amount)
+        self._transition_to("transform", tuple(offset))
+
+    def _set_opacity(self, value):
+        if "fade-out" in self.classList:
+            value = 0
+        elif value in ("", None):
+            value = 1
+        self._transition_to("opacity", float(value))
+
+
+class _SpriteStyle:
+    """Unset properties read as "" like they do on a real element's style."""
+
+    def __init__(self, sprite):
+        object.__setattr__(self, "_sprite", sprite)
+        object.__setattr__(self, "_values", {})
+
+    def __getattr__(self, name):
+        return self._values.get(name, "")
+
+    def __setattr__(self, name, value):
+        sprite = self._sprite
+        if name == "cssText":
+            self._values.clear()
+            sprite.transitions.clear()
+            sprite.offset = (0, 0)
+            sprite.angle = 0
+            sprite.opacity = 1
+        else:
+            self._values[name] = value
+            if name == "transform":
+                sprite._set_transform(value)
+            elif name == "opacity":
+                sprite._set_opacity(value)
+        if _renderer is not None:
+            _renderer.touch()
+
+
+class _SpriteClassList(set):
+    """Only the fade-in and fade-out classes change how a sprite is drawn."""
+
+    def __init__(self, sprite):
+        super().__init__()
+        self.sprite = sprite
+
+    def add(self, *names):
+        self.update(names)
+        self.sprite._set_opacity(self.sprite.style.opacity)
+
+    def remove(self, *names):
+        self.difference_update(names)
+        self.sprite._set_opacity(self.sprite.style.opacity)
+
+
+class _SpriteRenderer:
+    """
+    Draws every _Sprite onto one <canvas> at the back of #canvas, once per
+    game loop frame. Each file is loaded into a single <img> that all of its
+    sprites share (its add_image() template). Sprites stop moving while the
+    game is paused, like the <img> elements _pause() in animation.py freezes.
+    """
+
+    def __init__(self, parent):
+        width, height = _canvas_size()
+        self.canvas = document.createElement("canvas")
+        self.canvas.width = width
+        self.canvas.height = height
+        style = self.canvas.style
+        style.position = "absolute"
+        style.left = "0px"
+        style.top = "0px"
+        style.pointerEvents = "none"
+        parent.prepend(self.canvas)
+        self.context = self.canvas.getContext("2d")
+        self.parent = parent
+
+        # key -> sprite, in the order they're drawn
+        self.sprites = {}
+        # filename -> [image, natural size or None, (x, y, width, height) of
+        # its atlas frame or ()]
+        self.bitmaps = {}
+        self.dirty = True
+        self.moving = False
+        self.paused_at = None
+        self.click_listener = None
+        self.draw_calls = 0
+
+    def bitmap(self, filename):
+        bitmap = self.bitmaps.get(filename)
+        if bitmap is None:
+            frame = _atlas_frames.get(filename)
+            if frame is None:
+                bitmap = [_image_template(filename), None, ()]
+            else:
+                bitmap = [_image_template(frame[0]), None, frame[2]]
+            self.bitmaps[filename] = bitmap
+        return bitmap
+
+    def natural_size(self, bitmap):
+        if bitmap[1] is None:
+            image = bitmap[0]
+            if image.complete and image.naturalWidth:
+                if bitmap[2]:
+                    bitmap[1] = (bitmap[2][2], bitmap[2][3])
+                else:
+                    bitmap[1] = (image.naturalWidth, image.naturalHeight)
+        return bitmap[1]
+
+    def add(self, sprite):
+        self.sprites[_element_key(sprite)] = sprite
+        self.touch()
+
+    def remove(self, sprite):
+        if self.sprites.pop(getattr(sprite, "mylibrary_key", None), None) is not None:
+            self.touch()
+
+    def clear(self):
+        for key, sprite in list(self.sprites.items()):
+            _forget_element(sprite, key)
+        self.sprites = {}
+        self.touch()
+
+    def touch(self):
+        self.dirty = True
+        _game_loop.start()
+
+    def busy(self):
+        return self.dirty or self.moving
+
+    def listen_for_clicks(self):
+        # The <canvas> ignores the pointer so text and buttons on top of it
+        # still work, so clicks are picked up from its parent instead
+        if self.click_listener is None:
+            self.click_listener = _proxies.listen(self.parent, "click", self.on_click)
+
+    def on_click(self, event):
+        canvas_rect = self.canvas.getBoundingClientRect()
+        x = event.clientX - canvas_rect.left
+        y = event.clientY - canvas_rect.top
+        for key, sprite in reversed(list(self.sprites.items())):
+            if not sprite.listeners.get("click"):
+                continue
+            rect = _element_rect(sprite, key)
+            if rect[0] <= x < rect[2] and rect[1] <= y < rect[3]:
+                sprite.dispatchEvent(SimpleNamespace(type="click", target=sprite))
+                return
+
+    def _resume(self, paused_for):
+        for sprite in self.sprites.values():
+            for name, (start, end, start_time, duration) in list(sprite.transitions.items()):
+                sprite.transitions[name] = (start, end, start_time + paused_for, duration)
+            start_time = getattr(sprite, "start_time", None)
+            if start_time is not None:
+                sprite.start_time = start_time + paused_for
+
+    def draw(self, paused):
+        now = Date.now()
+        if paused:
+            if self.paused_at is None:
+                self.paused_at = now
+            now = self.paused_at
+        elif self.paused_at is not None:
+            self._resume(now - self.paused_at)
+            self.paused_at = None
+
+        width, height = _canvas_size()
+        context = self.context
+        context.clearRect(0, 0, width, height)
+        self.dirty = False
+        moving = False
+        ended = []
+
+        for key, sprite in list(self.sprites.items()):
+            natural = self.natural_size(sprite.bitmap)
+            if natural is None:
+                moving = True
+                continue
+            if sprite.onload is not None:
+                onload, sprite.onload = sprite.onload, None
+                onload(None)
+
+            for name, transition in sprite.transitions.items():
+                if now >= transition[2] + transition[3]:
+                    ended.append((sprite, name))
+                else:
+                    moving = True
+
+            x, y = sprite._value_at("transform", now)
+            opacity = sprite._value_at("opacity", now)
+            sprite_width, sprite_height = sprite._size()
+            left = sprite.offsetLeft + x
+            top = sprite.offsetTop + y
+            if (opacity <= 0 or left >= width or top >= height
+                    or left + sprite_width <= 0 or top + sprite_height <= 0):
+                continue
+
+            context.globalAlpha = opacity
+            if sprite.angle:
+                context.save()
+                context.translate(left + sprite_width / 2, top + sprite_height / 2)
+                context.rotate(sprite.angle * math.pi / 180)
+                context.drawImage(
+                    sprite.bitmap[0], *sprite.bitmap[2], -sprite_width / 2, -sprite_height / 2,
+                    sprite_width, sprite_height,
+                )
+                context.restore()
+            else:
+                context.drawImage(
+                    sprite.bitmap[0], *sprite.bitmap[2], left, top, sprite_width, sprite_height
+                )
+            self.draw_calls += 1
+        context.globalAlpha = 1
+        self.moving = moving
+
+        for sprite, name in ended:
+            if sprite.transitions.pop(name, None) is None:
+                continue
+            if getattr(sprite, "mylibrary_key", None) not in self.sprites:
+                continue
+            event = SimpleNamespace(type="transitionend", target=sprite, propertyName=name)
+            sprite.dispatchEvent(event)
+            _on_transition_end(event)
+
+
+# The renderer for "canvas" mode, see set_rendering_mode()
+_renderer = None
+
+
+def load_atlas(filename):
+    """
+    Loads a sprite atlas made by tools/build_atlas.py. After that, add_image()
+    of any file that was packed into the atlas shows its frame from the one
+    atlas image instead of loading the file itself. Call it before adding
+    those images. Files packed with --animated play their frames, with every
+    copy of the same file showing the same frame.
+
+    Parameters:
+        - filename (str): The atlas's .json file.
+
+    Returns:
+        - The filenames that are now drawn from the atlas.
+
+    Example usage:
+        load_atlas("images/atlas.json")
+        bat_image = add_image("images/bat.gif", 75)
+    """
+
+    try:
+        atlas = json.loads(open_url(filename).read())
+        image = atlas["image"]
+        frames = atlas["frames"]
+    except Exception:
+        raise Exception(
+            f"""
+Error in load_atlas()
+    - '{filename}' is not an atlas made by tools/build_atlas.py!
+"""
+        )
+
+    # One CSS rule per frame shows it from the atlas at any element size. A
+    # class (unlike inline styles) survives the pause button resetting styles.
+    stylesheet = document.createElement("style")
+    document.head.appendChild(stylesheet)
+    sheet = stylesheet.sheet
+
+    for name, frame in frames.items():
+        width, height = frame["w"], frame["h"]
+        css_class = f"mylibrary-frame-{len(_atlas_frames)}"
+        _atlas_frames[name] = (image, css_class, (frame["x"], frame["y"], width, height))
+
+        def position(x, y):
+            # As a percentage, so it doesn't depend on the element's size
+            room_x = atlas["width"] - width
+            room_y = atlas["height"] - height
+            return f"{x / room_x * 100 if room_x else 0}% {y / room_y * 100 if room_y else 0}%"
+
+        index = sheet.insertRule(
+            f"img.{css_class} {{ width: {width}px; aspect-ratio: {width} / {height};"
+            f" background: url({image}) no-repeat;"
+            f" background-size: {atlas['width'] / width * 100}% {atlas['height'] / height * 100}%;"
+            f" background-position: {position(frame['x'], frame['y'])}; }}",
+            sheet.cssRules.length,
+        )
+
+        if "animation" in frame:
+            _frame_animations.add(
+                name,
+                sheet.cssRules[index],
+                [
+                    (position(step["x"], step["y"]), (step["x"], step["y"], width, height), step["duration"])
+                    for step in frame["animation"]
+                ],
+            )
+
+    # Animated frames play even when nothing else keeps the game loop going,
+    # like a GIF does
+    if _frame_animations.animations:
+        _game_loop.start()
+
+    # Start loading the atlas now; its template reports it if it's missing
+    _image_template(image)
+    return list(frames)
+
+
+# filename -> (atlas image, CSS class, (x, y, width, height)) for every frame
+# of a loaded atlas
+_atlas_frames = {}
+
+
+class _FrameAnimations:
+    """
+    The one clock that every animated atlas frame runs on. Each game loop
+    frame works out which frame each animated file is on, and shows it for
+    every copy at once: by changing the file's CSS rule, and the rect the
+    canvas renderer draws for it. Nothing per image, however many there are.
+    """
+
+    def __init__(self):
+        # filename -> [CSS rule, [(CSS position, canvas rect, duration)], cycle length, frame shown]
+        self.animations = {}
+
+    def add(self, name, rule, steps):
+        self.animations[name] = [rule, steps, sum(step[2] for step in steps), 0]
+
+    def tick(self, now):
+        for name, animation in self.animations.items():
+            rule, steps, cycle, shown = animation
+            time = now % cycle
+            index = 0
+            while time >= steps[index][2]:
+                time -= steps[index][2]
+                index += 1
+            if index == shown:
+                continue
+
+            animation[3] = index
+            rule.style.backgroundPosition = steps[index][0]
+            if _renderer is not None and name in _renderer.bitmaps:
+                _renderer.bitmaps[name][2] = steps[index][1]
+
+
+_frame_animations = _FrameAnimations()
+
+
+def preload_assets(filenames):
+    """
+    Loads and decodes images ahead of time, so the first add_image() of each
+    one doesn't have to wait for the download or the decoding. The start
+    button isn't enabled until every image is ready.
+
+    Parameters:
+        - filenames (list): The image filenames to load.
+
+    Returns:
+        - A JavaScript Promise that resolves once every image is decoded.
+
+    Example usage:
+        preload_assets(["taco.png", "flying-cats.jpg"])
+        taco_image = add_image("taco.png", 100)
+    """
+
+    for filename in filenames:
+        if filename not in _preloaded:
+            _preloaded[filename] = _decode(filename)
+
+    # button_config.js waits for this before enabling the start button
+    window.mylibraryPreload = Promise.all(to_js(list(_preloaded.values())))
+    return window.mylibraryPreload
+
+
+def _decode(filename):
+    """Decodes the template for `filename`, see preload_assets()."""
+
+    # Only one of the two callbacks runs, so the other is destroyed with it
+    owner = ("preload", filename)
+
+    def settled(decoded):
+        _proxies.release(owner)
+        if not decoded:
+            _filename_not_found(filename, "preload_assets")
+
+    # An atlas frame's pixels are in the atlas image
+    source = _atlas_frames[filename][0] if filename in _atlas_frames else filename
+    return _image_template(source).decode().then(
+        _proxies.once(lambda _: settled(True), owner),
+        _proxies.once(lambda _: settled(False), owner),
+    )
+
+
+# filename -> the Promise of its template being decoded
+_preloaded = {}
+
+
+def set_rendering_mode(mode):
+    """
+    Chooses how add_image() shows images. In "dom" mode (the default) every
+    image is its own <img> element. In "canvas" mode every image is drawn
+    onto one <canvas> each frame instead, which stays fast with hundreds of
+    sprites on screen. Images work with all the same functions in both modes.
+    Call this before adding any images.
+
+    Parameters:
+        - mode (str): "dom" or "canvas".
+
+    Example usage:
+        set_rendering_mode("canvas")
+        bat_image = add_image("bat.gif", 75)
+        animate_right(bat_image, 1000)
+    """
+
+    global _renderer
+
+    if mode not in ("dom", "canvas"):
+        raise Exception(
+            f"""
+Error in set_rendering_mode()
+    - '{mode}' is not a valid rendering mode! Use "dom" or "canvas".
+"""
+        )
+
+    if mode == "canvas" and _renderer is None:
+        canvas = document.getElementById("canvas")
+        _renderer = _SpriteRenderer(canvas or document.body)
+    elif mode == "dom" and _renderer is not None:
+        _renderer.clear()
+        _renderer.canvas.remove()
+        _renderer = None
+    else:
+        return
+    # Pooled images only fit the mode they were made in
+    _image_pool.clear()
+
+
+def _forget_image(key, pooled):
+    if not pooled:
+        _image_sources.pop(key, None)
+
+
+def _clear_renderer():
+    if _renderer is not None:
+        _renderer.clear()
+
+
+def _render(paused):
+    if _frame_animations.animations:
+        _frame_animations.tick(Date.now())
+    if _renderer is not None:
+        _renderer.draw(paused)
+
+
+_hooks["forget"].append(_forget_image)
+_hooks["clear"].append(_clear_renderer)
+_hooks["busy"].append(lambda: _renderer is not None and _renderer.busy())
+_hooks["busy"].append(lambda: bool(_frame_animations.animations))
+_hooks["render"].append(_render)
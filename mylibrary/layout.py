@@ -0,0 +1,332 @@
+"""Positioning, moving, sizing, rotating and removing elements."""
+
+from ._core import document, window
+from ._core import _is_valid_element, _proxies, _dom_writes, _element_key, _element_sizes, _forget_element, _game_loop, _px
+
+
+def _is_invalid_x_position_keyword(x_position):
+    return x_position not in ["left", "right", "center"]
+
+
+def _is_invalid_y_position_keyword(y_position):
+    return y_position not in ["top", "bottom", "center"]
+
+
+def _offset_top(element):
+    # Use the last top written instead of forcing a layout
+    top = _px(_dom_writes.get_style(element, "top"))
+    if top is not None:
+        return int(top)
+    return int(element.offsetTop)
+
+
+def _offset_left(element):
+    left = _px(_dom_writes.get_style(element, "left"))
+    if left is not None:
+        return int(left)
+    return int(element.offsetLeft)
+
+
+@_is_valid_element("move_down")
+def move_down(element, distance):
+    """
+    Moves the `element` down by the given `distance`.
+
+    Parameters:
+        - element (element): The element to move down.
+        - distance (int): The distance the `element` should travel (in pixels).
+
+    Example usage:
+        def move_taco(pressed_key):
+            if pressed_key == "w":
+                move_up(taco_image, 10)
+            elif pressed_key == "a":
+                move_left(taco_image, 10)
+            elif pressed_key == "s":
+                move_down(taco_image, 10)
+            elif pressed_key == "d":
+                move_right(taco_image, 10)
+
+
+        taco_image = add_image("taco.jpg", 100)
+        position_element(taco_image, "center", "center")
+
+        keydown(move_taco)
+    """
+
+    _dom_writes.set_style(element, "position", "absolute")
+    _dom_writes.set_style(element, "top", str(_offset_top(element) + distance) + "px")
+
+
+@_is_valid_element("move_left")
+def move_left(element, distance):
+    """
+    Moves the `element` left by the given `distance`.
+
+    Parameters:
+        - element (element): The element to move left.
+        - distance (int): The distance the `element` should travel (in pixels).
+
+    Example usage:
+        def move_taco(pressed_key):
+            if pressed_key == "w":
+                move_up(taco_image, 10)
+            elif pressed_key == "a":
+                move_left(taco_image, 10)
+            elif pressed_key == "s":
+                move_down(taco_image, 10)
+            elif pressed_key == "d":
+                move_right(taco_image, 10)
+
+
+        taco_image = add_image("taco.jpg", 100)
+        position_element(taco_image, "center", "center")
+
+        keydown(move_taco)
+    """
+    _dom_writes.set_style(element, "position", "absolute")
+    _dom_writes.set_style(element, "left", str(_offset_left(element) + -distance) + "px")
+
+
+@_is_valid_element("move_right")
+def move_right(element, distance):
+    """
+    Moves the `element` right by the given `distance`.
+
+    Parameters:
+        - element (element): The element to move right.
+        - distance (int): The distance the `element` should travel (in pixels).
+
+    Example usage:
+        def move_taco(pressed_key):
+            if pressed_key == "w":
+                move_up(taco_image, 10)
+            elif pressed_key == "a":
+                move_left(taco_image, 10)
+            elif pressed_key == "s":
+                move_down(taco_image, 10)
+            elif pressed_key == "d":
+                move_right(taco_image, 10)
+
+
+        taco_image = add_image("taco.jpg", 100)
+        position_element(taco_image, "center", "center")
+
+        keydown(move_taco)
+    """
+
+    _dom_writes.set_style(element, "position", "absolute")
+    _dom_writes.set_style(element, "left", str(_offset_left(element) + distance) + "px")
+
+
+@_is_valid_element("move_up")
+def move_up(element, distance):
+    """
+    Moves the `element` up by the given `distance`.
+
+    Parameters:
+        - element (element): The element to move up.
+        - distance (int): The distance the `element` should travel (in pixels).
+
+    Example usage:
+        def move_taco(pressed_key):
+            if pressed_key == "w":
+                move_up(taco_image, 10)
+            elif pressed_key == "a":
+                move_left(taco_image, 10)
+            elif pressed_key == "s":
+                move_down(taco_image, 10)
+            elif pressed_key == "d":
+                move_right(taco_image, 10)
+
+
+        taco_image = add_image("taco.jpg", 100)
+        position_element(taco_image, "center", "center")
+
+        keydown(move_taco)
+    """
+
+    _dom_writes.set_style(element, "position", "absolute")
+    _dom_writes.set_style(element, "top", str(_offset_top(element) + -distance) + "px")
+
+
+@_is_valid_element("position_element")
+def position_element(element, x, y):
+    """
+    Position the `element` at the given `x` and `y` position. The `x` and `y`
+    arguments can be any `int`, or one of the position helpers:
+
+    |Position | Helper1  | Helper2    | Helper3    |
+    |---------|----------|------------|------------|
+    |`x`      | `"left"` | `"center"` | `"right"`  |
+    |`y`      | `"top"`  | `"center"` | `"bottom"` |
+
+    Parameters:
+        - element (element): The element to position.
+        - x (int|str): The desired x-position of the `element`.
+        - y (int|str): The desired y-position of the `element`.
+
+    Example usage:
+        taco_image = add_image("taco.jpg")
+        position_element(taco_image, "center", 400)
+    """
+
+    _dom_writes.set_style(element, "position", "absolute")
+
+    get_flex_align = {
+        "center": "center",
+        "right": "flex-end",
+        "left": "flex-start",
+    }
+
+    if isinstance(x, str):
+        if _is_invalid_x_position_keyword(x):
+            raise Exception(
+                f"""
+Error in position_element()
+    - '{x}' is not a valid position shortcut!
+"""
+            )
+        _dom_writes.set_style(element, "alignSelf", get_flex_align[x])
+    else:
+        _dom_writes.set_style(element, "left", str(x) + "px")
+
+    if isinstance(y, str):
+        if _is_invalid_y_position_keyword(y):
+            raise Exception(
+                f"""
+Error in position_element()
+    - '{y}' is not a valid position shortcut!
+"""
+            )
+        elif y == "bottom":
+            _when_loaded(element, _set_y_to_bottom)
+        elif y == "top":
+            _when_loaded(element, _set_y_to_top)
+        elif y == "center":
+            _when_loaded(element, _set_y_to_center)
+    else:
+        _dom_writes.set_style(element, "top", str(y) + "px")
+
+
+def _when_loaded(element, set_y):
+    """
+    Runs set_y(element) once an image knows its height. An image that
+    add_image() reused has loaded already, so its onload won't fire again.
+    """
+
+    if element.tagName != "IMG":
+        set_y(element)
+    elif getattr(element, "complete", False) and element.naturalWidth:
+        if element.isConnected:
+            set_y(element)
+        else:
+            # Batched, so it's only appended at the next flush
+            _game_loop.defer(lambda: set_y(element))
+    else:
+        element.onload = _proxies.once(lambda _: set_y(element), _element_key(element))
+
+
+@_is_valid_element("set_element_width")
+def set_element_width(element, width):
+    """
+    Sets the `element` to the given `width`.
+
+    Parameters:
+        - element (element): The element to adjust.
+        - width (int): The desired width of the `element`.
+
+    Example usage:
+        def shrink_taco():
+            set_element_width(taco_image, 100)
+
+
+        shrink_taco_button = add_button("Shrink Taco")
+        position_element(shrink_taco_button, "center", "center")
+
+        taco_image = add_image("taco.jpg", 300)
+        position_element(taco_image, "center", 200)
+
+        click(shrink_taco_button, shrink_taco)
+    """
+
+    _dom_writes.set_style(element, "width", width + "px")
+    _element_sizes.pop(_element_key(element), None)
+
+
+@_is_valid_element("_set_y_to_bottom")
+def _set_y_to_bottom(element):
+    canvas = document.querySelector("#canvas")
+    if canvas:
+        top = canvas.offsetHeight - element.offsetHeight
+    else:
+        top = window.innerHeight - element.offsetHeight
+    _dom_writes.set_style(element, "top", str(top) + "px")
+
+
+@_is_valid_element("_set_y_to_top")
+def _set_y_to_top(element):
+    _dom_writes.set_style(element, "top", "0px")
+
+
+@_is_valid_element("_set_y_to_center")
+def _set_y_to_center(element):
+    canvas = document.querySelector("#canvas")
+    if canvas:
+        top = (canvas.offsetHeight / 2) - (element.offsetHeight / 2)
+    else:
+        top = (window.innerHeight / 2) - (element.offsetHeight / 2)
+    _dom_writes.set_style(element, "top", str(top) + "px")
+
+
+@_is_valid_element("remove_element")
+def remove_element(element):
+    """
+    Removes the `element` from the page. It isn't reused by a later
+    add_image(), unlike an image that animates off the canvas.
+
+    Parameters:
+        - element (element): The element to remove.
+
+    Example usage:
+        def remove_taco():
+            remove_element(taco_image)
+
+
+        taco_image = add_image("taco.jpg", 200)
+        position_element(taco_image, "center", 300)
+
+        remove_taco_button = add_button("Remove Taco")
+        position_element(remove_taco_button, "center", "center")
+
+        click(remove_taco_button, remove_taco)
+    """
+
+    _forget_element(element)
+    element.remove()
+
+
+@_is_valid_element("rotate_element")
+def rotate_element(element, degrees):
+    """
+    Rotates the `element` by the given number of `degrees`.
+
+    Parameters:
+        - element (element): The element to rotate.
+        - degrees (int): The number of degrees to rotate the `element`.
+
+    Example usage:
+        def rotate_taco():
+            rotate_element(taco_image, 180)
+
+
+        taco_image = add_image("taco.jpg", 200)
+        position_element(taco_image, "center", 300)
+
+        rotate_taco_button = add_button("Rotate Taco")
+        position_element(rotate_taco_button, "center", "center")
+
+        click(rotate_taco_button, rotate_taco)
+    """
+
+    _dom_writes.set_style(element, "transform", f"rotate({degrees}deg)")
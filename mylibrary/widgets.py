@@ -0,0 +1,400 @@
+"""Text, buttons, text inputs and colors."""
+
+from ._core import document, _is_valid_element, _dom_writes, _elements, _ElementHandle
+
+
+_valid_colors = [
+    "white",
+    "silver",
+    "gray",
+    "black",
+    "red",
+    "maroon",
+    "yellow",
+    "olive",
+    "lime",
+    "green",
+    "aqua",
+    "teal",
+    "blue",
+    "navy",
+    "fuchsia",
+    "purple",
+    "orange",
+    "mediumvioletred",
+    "deeppink",
+    "palevioletred",
+    "hotpink",
+    "lightpink",
+    "pink",
+    "darkred",
+    "firebrick",
+    "crimson",
+    "indianred",
+    "lightcoral",
+    "salmon",
+    "darksalmon",
+    "lightsalmon",
+    "orangered",
+    "tomato",
+    "darkorange",
+    "coral",
+    "darkkhaki",
+    "gold",
+    "khaki",
+    "peachpuff",
+    "palegoldenrod",
+    "moccasin",
+    "papayawhip",
+    "lightgoldenrodyellow",
+    "lemonchiffon",
+    "lightyellow",
+    "brown",
+    "saddlebrown",
+    "sienna",
+    "chocolate",
+    "darkgoldenrod",
+    "peru",
+    "rosybrown",
+    "goldenrod",
+    "sandybrown",
+    "tan",
+    "burlywood",
+    "wheat",
+    "navajowhite",
+    "bisque",
+    "blanchedalmond",
+    "cornsilk",
+    "darkgreen",
+    "darkolivegreen",
+    "forestgreen",
+    "seagreen",
+    "olivedrab",
+    "mediumseagreen",
+    "limegreen",
+    "springgreen",
+    "mediumspringgreen",
+    "darkseagreen",
+    "mediumaquamarine",
+    "yellowgreen",
+    "lawngreen",
+    "chartreuse",
+    "lightgreen",
+    "greenyellow",
+    "palegreen",
+    "darkcyan",
+    "lightseagreen",
+    "cadetblue",
+    "darkturquoise",
+    "mediumturquoise",
+    "turquoise",
+    "cyan",
+    "aquamarine",
+    "paleturquoise",
+    "lightcyan",
+    "darkblue",
+    "mediumblue",
+    "midnightblue",
+    "royalblue",
+    "steelblue",
+    "dodgerblue",
+    "deepskyblue",
+    "cornflowerblue",
+    "skyblue",
+    "lightskyblue",
+    "lightsteelblue",
+    "lightblue",
+    "powderblue",
+    "indigo",
+    "darkmagenta",
+    "darkviolet",
+    "darkslateblue",
+    "blueviolet",
+    "darkorchid",
+    "magenta",
+    "slateblue",
+    "mediumslateblue",
+    "mediumorchid",
+    "mediumpurple",
+    "orchid",
+    "violet",
+    "plum",
+    "thistle",
+    "lavender",
+    "mistyrose",
+    "antiquewhite",
+    "linen",
+    "beige",
+    "whitesmoke",
+    "lavenderblush",
+    "oldlace",
+    "aliceblue",
+    "seashell",
+    "ghostwhite",
+    "honeydew",
+    "floralwhite",
+    "azure",
+    "mintcream",
+    "snow",
+    "ivory",
+    "darkslategray",
+    "dimgray",
+    "slategray",
+    "lightslategray",
+    "darkgray",
+    "lightgray",
+    "gainsboro",
+]
+
+
+def add_button(text):
+    """
+    Adds a button.
+
+    Parameters:
+        - text (str): The text on the button.
+
+    Returns:
+        - The button element.
+
+    Example usage:
+        button = add_button("Click Me")
+    """
+
+    element = _ElementHandle(document.createElement("button"), "BUTTON")
+    element.textContent = text
+    _dom_writes.set_style(element, "alignSelf", "flex-start")
+
+    canvas = document.getElementById("canvas")
+
+    if canvas:
+        _dom_writes.append(canvas, element)
+    else:
+        _dom_writes.append(document.body, element)
+
+    _elements.add(element, "button")
+
+    return element
+
+
+def add_text(text, size=18):
+    """
+    Adds text to the page.
+
+    Parameters:
+        - text (str): The text to add to the page.
+        - size (int): The size, in pixels (optional).
+
+    Returns:
+        - The text element.
+
+    Example usage:
+        mylibrary_text = add_text("mylibrary is cool!")
+    """
+
+    element = _ElementHandle(document.createElement("p"), "P")
+    text = str(text)
+    element.innerHTML = text.replace("\\n", "<br />")
+    element.innerHTML = text.replace("\n", "<br />")
+    element.style.fontSize = str(size) + "px"
+    
+
+    canvas = document.getElementById("canvas")
+
+    if canvas:
+        _dom_writes.append(canvas, element)
+    else:
+        _dom_writes.append(document.body, element)
+
+    _elements.add(element, "text")
+
+    return element
+
+
+def add_text_input(placeholder):
+    """
+    Adds a text input to the page.
+
+    Parameters:
+        - placeholder (str): The text to display in the input box.
+
+    Returns:
+        - The text input element.
+
+    Example usage:
+        text_input = add_text_input("Enter your password:")
+    """
+
+    element = _ElementHandle(document.createElement("input"), "INPUT")
+    element.placeholder = placeholder
+
+    canvas = document.getElementById("canvas")
+
+    if canvas:
+        _dom_writes.append(canvas, element)
+    else:
+        _dom_writes.append(document.body, element)
+
+    _elements.add(element, "input")
+
+    return element
+
+
+@_is_valid_element("get_input_value")
+def get_input_value(element):
+    """
+    Gets the value of the input `element`.
+
+    Parameters:
+        - element (element): The element to get the value from.
+
+    Example usage:
+        def login():
+            password = get_input_value(password_input)
+            clear()
+            if password == "secretpassword":
+                logged_in_text = add_text("You've logged in!", 32)
+                position_element(logged_in_text, "center", 400)
+
+
+        password_input = add_text_input("Enter your password")
+        position_element(password_input, "center", 400)
+
+        login_button = add_button("Login")
+        position_element(login_button, "center", "center")
+        click(login_button, login)
+    """
+
+    return element.value
+
+
+def _is_invalid_color(color):
+    if color.lower() not in _valid_colors:
+        if not color:
+            return True
+        if color[0] != "#":
+            return True
+        if len(color) != 7:
+            return True
+    return False
+
+
+def set_background_color(color):
+    """
+    Sets the background color of the page to `color`.
+
+    Parameters:
+        - color (str): The desired background color.
+
+    Example usage:
+        set_background_color("darksalmon")
+    """
+
+    element = document.querySelector("html")
+
+    if _is_invalid_color(color):
+        raise Exception(
+            f"""
+Error in set_background_color()
+    - '{color}' is not a valid color name!
+"""
+        )
+
+    element.style.backgroundColor = color.lower()
+
+
+@_is_valid_element("set_font_size")
+def set_font_size(element, font_size):
+    """
+    Sets the font size of the `element` to the given `font_size`.
+
+    Parameters:
+        - element (element): The element to adjust.
+        - font_size (int): The desired font size of the `element`.
+
+    Example usage:
+        def shrink_text():
+            set_font_size(text_element, 25)
+
+
+        shrink_text_button = add_button("Shrink Font")
+        position_element(shrink_text_button, "center", "center")
+
+        text_element = add_text("Shrink this text!", 100)
+        position_element(text_element, "center", 300)
+
+        click(shrink_text_button, shrink_text)
+    """
+
+    element.style.fontSize = str(font_size) + "px"
+
+
+@_is_valid_element("set_text_color")
+def set_text_color(text_element, color):
+    """
+    Sets the `color` of the `text_element`.
+
+    Parameters:
+        - text_element (element): The text element to adjust.
+        - color (str): The desired color of the `text_element`.
+
+    Example usage:
+        red_text = add_text("This text is red", 32)
+        set_text_color(red_text, "red")
+    """
+
+    if _is_invalid_color(color):
+        raise Exception(
+            f"""
+Error in set_text_color()
+    - '{color}' is not a valid color name!
+"""
+        )
+
+    text_element.style.color = color
+
+
+@_is_valid_element("set_text_decoration")
+def set_text_decoration(text_element, decoration_string):
+    """
+    Sets the text decoration of the given `text_element`.
+
+    Parameters:
+        - text_element (element): The text element to adjust.
+        - decoration_string (str): The decoration string for the CSS property.
+
+    Read about different options for the decoration_string here:
+        - https://developer.mozilla.org/en-US/docs/Web/CSS/text-decoration
+
+    Example usage:
+        text_element = add_text("Never Gonna Give You Up", 42)
+        set_text_decoration(text_element, "underline dotted blue")
+    """
+
+    text_element.style.textDecoration = decoration_string
+
+
+@_is_valid_element("update_text")
+def update_text(text_element, new_text):
+    """
+    Changes the text in `text_element` to the `new_text`.
+
+    Parameters:
+        - text_element (element): The element to adjust.
+        - new_text (str): The new text for the `text_element`.
+
+    Example usage:
+        def update_text_element():
+            update_text(text_element, "Updated text")
+
+
+        text_element = add_text("Original text", 32)
+        position_element(text_element, "center", 400)
+
+        update_text_button = add_button("Update Text")
+        position_element(update_text_button, "center", "center")
+
+        click(update_text_button, update_text_element)
+    """
+    new_text = str(new_text)
+    _dom_writes.set_property(text_element, "textContent", new_text)
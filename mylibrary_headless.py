@@ -0,0 +1,957 @@
+"""
+A pure-Python stand-in for the parts of the browser that mylibrary uses, so a
+game written with mylibrary can run under plain CPython.
+
+mylibrary imports this instead of `js` and `pyodide` when they aren't
+available (or when the MYLIBRARY_HEADLESS environment variable is set). Time
+comes from a virtual clock, so a whole round runs as fast as the CPU allows
+and the same seed always plays out the same way.
+
+Example usage:
+    python mylibrary_headless.py program.py --seconds 140 --seed 1
+"""
+
+import io
+import math
+import os
+import re
+import sys
+import random
+from types import SimpleNamespace
+
+# Where relative filenames (images, audio) are looked up, see run_program()
+asset_root = "."
+
+
+class _Clock:
+    """
+    The virtual clock. Nothing happens until it is advanced: advancing runs
+    every timeout that falls due and one requestAnimationFrame batch per
+    frame, in time order.
+    """
+
+    def __init__(self, frame_ms=1000 / 60):
+        self.now = 1_000_000.0
+        self.frame_ms = frame_ms
+        self.next_frame = self.now
+        self.timeouts = []
+        self.frame_callbacks = []
+        self.next_id = 1
+        self.stats = {"frames": 0, "callbacks": 0}
+
+    def set_timeout(self, callback, ms=0):
+        timer_id = self.next_id
+        self.next_id += 1
+        self.timeouts.append((self.now + (ms or 0), timer_id, callback))
+        return timer_id
+
+    def clear_timeout(self, timer_id):
+        self.timeouts = [entry for entry in self.timeouts if entry[1] != timer_id]
+
+    def request_frame(self, callback):
+        frame_id = self.next_id
+        self.next_id += 1
+        self.frame_callbacks.append((frame_id, callback))
+        return frame_id
+
+    def cancel_frame(self, frame_id):
+        self.frame_callbacks = [
+            entry for entry in self.frame_callbacks if entry[0] != frame_id
+        ]
+
+    def _run_timeouts(self, until):
+        while True:
+            due = [entry for entry in self.timeouts if entry[0] <= until]
+            if not due:
+                return
+            entry = min(due)
+            self.timeouts.remove(entry)
+            self.now = max(self.now, entry[0])
+            self.stats["callbacks"] += 1
+            entry[2]()
+
+    def _run_frame(self):
+        callbacks, self.frame_callbacks = self.frame_callbacks, []
+        for frame_id, callback in callbacks:
+            self.stats["callbacks"] += 1
+            callback(self.now)
+        self.stats["frames"] += 1
+        document._end_transitions(self.now)
+
+    def advance(self, ms):
+        """Moves time forward by `ms`, running everything that falls due."""
+        end = self.now + ms
+        while self.next_frame <= end:
+            self._run_timeouts(self.next_frame)
+            self.now = self.next_frame
+            self._run_frame()
+            self.next_frame += self.frame_ms
+        self._run_timeouts(end)
+        self.now = end
+
+    def run_for(self, seconds, on_frame=None):
+        """
+        Advances the clock `seconds` one frame at a time, calling
+        `on_frame(now)` before each frame if it's given.
+        """
+        end = self.now + seconds * 1000
+        while self.now < end:
+            if on_frame is not None:
+                on_frame(self.now)
+            self.advance(min(self.frame_ms, end - self.now))
+
+
+clock = _Clock()
+
+
+class Date:
+    @staticmethod
+    def now():
+        return clock.now
+
+
+def setTimeout(callback, ms=0):
+    return clock.set_timeout(callback, ms)
+
+
+def clearTimeout(timer_id):
+    clock.clear_timeout(timer_id)
+
+
+def requestAnimationFrame(callback):
+    return clock.request_frame(callback)
+
+
+def cancelAnimationFrame(frame_id):
+    clock.cancel_frame(frame_id)
+
+
+def prompt(text):
+    return ""
+
+
+class Promise:
+    """
+    Only what mylibrary needs: promises that are already settled, so
+    callbacks run straight away.
+    """
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+    @staticmethod
+    def resolve(value=None):
+        return Promise(value)
+
+    @staticmethod
+    def all(promises):
+        for promise in promises:
+            if promise.error is not None:
+                return promise
+        return Promise([promise.value for promise in promises])
+
+    def then(self, on_resolved, on_rejected=None):
+        if self.error is None:
+            return Promise._settled(on_resolved(self.value))
+        if on_rejected is not None:
+            return Promise._settled(on_rejected(self.error))
+        return self
+
+    @staticmethod
+    def _settled(value):
+        # A callback that returns a promise is followed, like in JavaScript
+        return value if isinstance(value, Promise) else Promise(value)
+
+    def catch(self, on_rejected):
+        return self.then(lambda value: value, on_rejected)
+
+
+def to_js(value):
+    return value
+
+
+def open_url(url):
+    with open(os.path.join(asset_root, url)) as file:
+        return io.StringIO(file.read())
+
+
+class _Storage(dict):
+    def getItem(self, key):
+        return self.get(key)
+
+    def setItem(self, key, value):
+        self[key] = str(value)
+
+    def removeItem(self, key):
+        self.pop(key, None)
+
+
+localStorage = _Storage()
+
+
+class _AudioNode:
+    def __init__(self, context):
+        self.context = context
+        self.gain = SimpleNamespace(value=1)
+        self.buffer = None
+        self.onended = None
+        self._playing = False
+
+    def connect(self, destination):
+        pass
+
+    def start(self):
+        # Like <audio> elements, every buffer lasts a second
+        self._playing = True
+        document.sounds_played += 1
+        clock.set_timeout(self._end, 1000)
+
+    def stop(self):
+        if self._playing:
+            clock.set_timeout(self._end, 0)
+
+    def _end(self):
+        if self._playing:
+            self._playing = False
+            if self.onended is not None:
+                self.onended(_Event("ended", self))
+
+
+class AudioContext:
+    """A Web Audio context whose sounds are counted, not heard."""
+
+    def __init__(self):
+        self.state = "suspended"
+        self.destination = _AudioNode(self)
+
+    @classmethod
+    def new(cls):
+        return cls()
+
+    def resume(self):
+        self.state = "running"
+        return Promise()
+
+    def createGain(self):
+        return _AudioNode(self)
+
+    def createBufferSource(self):
+        return _AudioNode(self)
+
+    def createMediaElementSource(self, element):
+        return _AudioNode(self)
+
+    def decodeAudioData(self, data):
+        return Promise(SimpleNamespace(duration=1, length=len(data)))
+
+
+def fetch(url):
+    path = os.path.join(asset_root, url)
+    if not os.path.exists(path):
+        return Promise(SimpleNamespace(ok=False, status=404))
+
+    def array_buffer():
+        with open(path, "rb") as file:
+            return Promise(file.read())
+
+    return Promise(SimpleNamespace(ok=True, status=200, arrayBuffer=array_buffer))
+
+
+class _RenderCommands:
+    """render_commands.js, which applies batch_writes(buffer=True)'s records."""
+
+    _TRANSFORMS = [None, ("translateX", "px"), ("translateY", "px"), ("rotate", "deg")]
+
+    def __init__(self):
+        self.elements = {}
+        self.calls = 0
+
+    def register(self, key, element):
+        self.elements[key] = element
+
+    def apply(self, buffer):
+        self.calls += 1
+        for i in range(0, len(buffer), 6):
+            key, left, top, transform, amount, opacity = buffer[i:i + 6]
+            if key < 0:
+                self.elements.pop(-key, None)
+                continue
+            element = self.elements.get(key)
+            if element is None:
+                continue
+            style = element.style
+            if not math.isnan(left):
+                style.left = _js_number(left) + "px"
+            if not math.isnan(top):
+                style.top = _js_number(top) + "px"
+            if transform == 0:
+                style.transform = ""
+            elif not math.isnan(transform):
+                name, unit = self._TRANSFORMS[int(transform)]
+                style.transform = f"{name}({_js_number(amount)}{unit})"
+            if not math.isnan(opacity):
+                style.opacity = _js_number(opacity)
+
+
+def _js_number(value):
+    """How JavaScript turns a number into a string: 100 rather than 100.0."""
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+class _Window:
+    innerWidth = 1280
+    innerHeight = 800
+    AudioContext = AudioContext
+    fetch = staticmethod(fetch)
+
+    def __init__(self):
+        self.mylibraryRender = _RenderCommands()
+
+
+window = _Window()
+
+
+# --- Proxies ---
+
+
+class _Proxy:
+    """Stands in for the JS function pyodide makes from a Python callable."""
+
+    live = 0
+    peak = 0
+
+    def __init__(self, function, once=False):
+        self.function = function
+        self.once = once
+        self.destroyed = False
+        _Proxy.live += 1
+        _Proxy.peak = max(_Proxy.peak, _Proxy.live)
+
+    def __call__(self, *args):
+        if self.destroyed:
+            raise Exception("This borrowed proxy was automatically destroyed")
+        if self.once:
+            self.destroy()
+        return self.function(*args)
+
+    def destroy(self):
+        if self.destroyed:
+            raise Exception("Object has already been destroyed")
+        self.destroyed = True
+        _Proxy.live -= 1
+
+
+def create_proxy(function):
+    return _Proxy(function)
+
+
+def create_once_callable(function):
+    return _Proxy(function, once=True)
+
+
+# --- Elements ---
+
+
+class _Event:
+    def __init__(self, event_type, target=None, **fields):
+        self.type = event_type
+        self.target = target
+        self.__dict__.update(fields)
+
+
+class _Rect:
+    def __init__(self, left, top, width, height):
+        self.left = self.x = left
+        self.top = self.y = top
+        self.width = width
+        self.height = height
+        self.right = left + width
+        self.bottom = top + height
+
+
+class _Style:
+    """Unset properties read as "" like they do on a real CSSStyleDeclaration."""
+
+    def __init__(self, element):
+        object.__setattr__(self, "_element", element)
+        object.__setattr__(self, "_values", {})
+
+    def __getattr__(self, name):
+        return self._values.get(name, "")
+
+    def __setattr__(self, name, value):
+        if name == "cssText":
+            self._values.clear()
+            self._element._set_transform("")
+            return
+        document.style_writes += 1
+        value = "" if value is None else str(value)
+        if name == "transform":
+            self._element._set_transform(value)
+        self._values[name] = value
+
+
+class _ClassList(set):
+    def add(self, *names):
+        self.update(names)
+
+    def remove(self, *names):
+        for name in names:
+            self.discard(name)
+
+    def contains(self, name):
+        return name in self
+
+
+_translate_pattern = re.compile(r"translate([XY])\((-?[\d.]+)px\)")
+_transition_pattern = re.compile(r"([\d.]+)s linear transform")
+
+
+class Element:
+    """
+    An element with just enough of the DOM for mylibrary: a style whose
+    transform transitions are played out against the virtual clock, events,
+    and a simple box model inside a 1000x600 canvas.
+    """
+
+    def __init__(self, tag_name):
+        self.tagName = tag_name.upper()
+        self.id = ""
+        self.style = _Style(self)
+        self.classList = _ClassList()
+        self.children = []
+        self.parentNode = None
+        self.listeners = {}
+        self.textContent = ""
+        self.disabled = False
+        self.onload = None
+        self.onclick = None
+        self.paused = True
+        self.currentTime = 0
+        # Current translate offset and the transition moving it
+        self._offset = (0.0, 0.0)
+        self._transition = None
+        self._src = ""
+        document._created += 1
+
+    def __repr__(self):
+        return f"<{self.tagName.lower()} id={self.id!r}>"
+
+    # Tree
+
+    def appendChild(self, child):
+        if child.parentNode is not None:
+            child.parentNode.children.remove(child)
+        child.parentNode = self
+        self.children.append(child)
+        document._attached_changed()
+        return child
+
+    def prepend(self, child):
+        self.appendChild(child)
+        self.children.insert(0, self.children.pop())
+
+    def remove(self):
+        if self.parentNode is not None:
+            self.parentNode.children.remove(self)
+            self.parentNode = None
+            document._attached_changed()
+
+    def _walk(self):
+        for child in self.children:
+            yield child
+            yield from child._walk()
+
+    def closest(self, selector):
+        node = self
+        while node is not None:
+            if _matches(node, selector):
+                return node
+            node = node.parentNode
+        return None
+
+    @property
+    def isConnected(self):
+        node = self
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is document.documentElement
+
+    # Content
+
+    @property
+    def innerHTML(self):
+        return self.textContent
+
+    @innerHTML.setter
+    def innerHTML(self, value):
+        self.textContent = re.sub(r"<br\s*/?>", "\n", str(value))
+
+    @property
+    def src(self):
+        return self._src
+
+    @src.setter
+    def src(self, value):
+        self._src = value
+        if not self.complete:
+            # Browsers report a missing file asynchronously
+            clock.set_timeout(lambda: self.dispatchEvent(_Event("error", self)), 0)
+        else:
+            # Whatever onload is set by the time it has loaded runs
+            clock.set_timeout(self._loaded, 0)
+
+    def _loaded(self):
+        if self.onload is not None:
+            self.onload(_Event("load", self))
+
+    @property
+    def complete(self):
+        if self._src.startswith("data:"):
+            return True
+        return bool(self._src) and os.path.exists(os.path.join(asset_root, self._src))
+
+    @property
+    def naturalWidth(self):
+        return 100 if self.complete else 0
+
+    naturalHeight = naturalWidth
+
+    def setAttribute(self, name, value):
+        if name in ("id", "src"):
+            setattr(self, name, value)
+        else:
+            self.__dict__.setdefault("_attributes", {})[name] = str(value)
+
+    def getAttribute(self, name):
+        if name in ("id", "src"):
+            return getattr(self, name) or None
+        return self.__dict__.get("_attributes", {}).get(name)
+
+    def cloneNode(self, deep=False):
+        clone = Element(self.tagName)
+        for name, value in self.style._values.items():
+            setattr(clone.style, name, value)
+        clone.classList.update(self.classList)
+        clone.id = self.id
+        clone._src = self._src
+        return clone
+
+    def decode(self):
+        if self.complete:
+            return Promise(self)
+        return Promise(error=Exception("EncodingError: The source image cannot be decoded."))
+
+    @property
+    def sheet(self):
+        if "_sheet" not in self.__dict__:
+            self._sheet = _StyleSheet()
+        return self._sheet
+
+    def getContext(self, context_type):
+        return _Context2D()
+
+    def play(self):
+        # Media files aren't read, so every sound lasts a second
+        self.paused = False
+        self._plays = plays = getattr(self, "_plays", 0) + 1
+        document.sounds_played += 1
+
+        def ended():
+            if self._plays == plays and not getattr(self, "loop", False):
+                self.paused = True
+
+        clock.set_timeout(ended, 1000)
+
+    def pause(self):
+        self.paused = True
+
+    # Events
+
+    def addEventListener(self, event_type, listener):
+        self.listeners.setdefault(event_type, []).append(listener)
+
+    def removeEventListener(self, event_type, listener):
+        listeners = self.listeners.get(event_type, [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def dispatchEvent(self, event, bubbles=True):
+        if event.target is None:
+            event.target = self
+        node = self
+        while node is not None:
+            for listener in list(node.listeners.get(event.type, ())):
+                listener(event)
+            if event.type == "click" and node.onclick is not None:
+                node.onclick(event)
+            if not bubbles:
+                break
+            node = node.parentNode
+        return True
+
+    def click(self):
+        if not self.disabled:
+            self.dispatchEvent(_Event("click", self))
+
+    # Layout
+
+    def _size(self):
+        width = _px(self.style.width)
+        font_size = _px(self.style.fontSize) or 18
+        if self.tagName == "IMG":
+            width = width or 100
+            return width, width
+        if self.tagName == "P":
+            lines = self.textContent.split("\n")
+            width = width or min(610, max(len(line) for line in lines) * font_size * 0.6 + 40)
+            return width, len(lines) * 33 + 40
+        if self.tagName == "BUTTON":
+            return width or 100, 50
+        if self.tagName == "INPUT":
+            return width or 300, 35
+        if self.id == "canvas":
+            return 1000, 600
+        return width or 0, 0
+
+    def _layout_position(self):
+        width, height = self._size()
+        left = _px(self.style.left)
+        if left is None:
+            align = self.style.alignSelf
+            if align == "center":
+                left = (1000 - width) / 2
+            elif align == "flex-end":
+                left = 1000 - width
+            else:
+                left = 0
+        top = _px(self.style.top)
+        return left, top if top is not None else 0
+
+    @property
+    def offsetLeft(self):
+        return self._layout_position()[0]
+
+    @property
+    def offsetTop(self):
+        return self._layout_position()[1]
+
+    # Elements that aren't on the page have no layout, so no size
+
+    @property
+    def offsetWidth(self):
+        return self._size()[0] if self.isConnected else 0
+
+    @property
+    def offsetHeight(self):
+        return self._size()[1] if self.isConnected else 0
+
+    def getBoundingClientRect(self):
+        if self.id == "canvas":
+            return _Rect(0, 0, 1000, 600)
+        left, top = self._layout_position()
+        offset_x, offset_y = self._current_offset(clock.now)
+        width, height = self._size()
+        return _Rect(left + offset_x, top + offset_y, width, height)
+
+    # Transitions
+
+    def _current_offset(self, now):
+        transition = self._transition
+        if transition is None:
+            return self._offset
+        start, end, start_time, duration = transition
+        progress = min((now - start_time) / duration, 1) if duration else 1
+        return (
+            start[0] + (end[0] - start[0]) * progress,
+            start[1] + (end[1] - start[1]) * progress,
+        )
+
+    def _set_transform(self, value):
+        target = [0.0, 0.0]
+        for axis, amount in _translate_pattern.findall(value):
+            target["XY".index(axis)] = float(amount)
+        target = tuple(target)
+
+        current = self._current_offset(clock.now)
+        match = _transition_pattern.search(self.style.transition)
+        if match and value and target != current:
+            self._transition = (current, target, clock.now, float(match.group(1)) * 1000)
+            document._transitions.add(self)
+        else:
+            self._transition = None
+            document._transitions.discard(self)
+        self._offset = target
+
+    def _end_transition(self, now):
+        transition = self._transition
+        if transition is None or now < transition[2] + transition[3]:
+            return False
+        self._transition = None
+        self.dispatchEvent(_Event("transitionend", self, propertyName="transform"))
+        return True
+
+
+class _StyleSheet:
+    """A <style> element's sheet, where each rule only keeps its style."""
+
+    def __init__(self):
+        self.cssRules = _RuleList()
+
+    def insertRule(self, text, index=0):
+        self.cssRules.insert(index, SimpleNamespace(cssText=text, style=SimpleNamespace()))
+        return index
+
+
+class _RuleList(list):
+    @property
+    def length(self):
+        return len(self)
+
+
+class _Context2D:
+    """A 2D canvas context that only counts what would have been drawn."""
+
+    def __init__(self):
+        self.globalAlpha = 1
+
+    def drawImage(self, image, *args):
+        document.draw_calls += 1
+
+    def clearRect(self, *args):
+        pass
+
+    save = restore = translate = rotate = clearRect
+
+
+def _px(value):
+    if value and value.endswith("px"):
+        return float(value[:-2])
+    return None
+
+
+class _Document:
+    """
+    The page from index.html: a start button, a #canvas and a body to put
+    audio in, with the handful of selectors mylibrary uses.
+    """
+
+    def __init__(self):
+        self._created = 0
+        self._transitions = set()
+        self.live_elements = 0
+        self.peak_elements = 0
+        self.draw_calls = 0
+        self.sounds_played = 0
+        self.style_writes = 0
+
+    def _build(self):
+        self.documentElement = Element("html")
+        self.head = self.documentElement.appendChild(Element("head"))
+        self.body = self.documentElement.appendChild(Element("body"))
+        container = self.body.appendChild(Element("div"))
+        container.id = "container"
+        buttons = container.appendChild(Element("div"))
+        buttons.classList.add("button-container")
+        start_button = buttons.appendChild(Element("button"))
+        start_button.id = "start"
+        canvas = container.appendChild(Element("div"))
+        canvas.id = "canvas"
+        blackout = canvas.appendChild(Element("div"))
+        blackout.id = "blackout"
+        self._created = 0
+
+    def _attached_changed(self):
+        if getattr(self, "documentElement", None) is None:
+            return
+        self.live_elements = sum(1 for _ in self.documentElement._walk())
+        self.peak_elements = max(self.peak_elements, self.live_elements)
+
+    def _end_transitions(self, now):
+        for element in list(self._transitions):
+            if element._end_transition(now):
+                self._transitions.discard(element)
+
+    def createElement(self, tag_name):
+        return Element(tag_name)
+
+    def getElementById(self, element_id):
+        for element in self.documentElement._walk():
+            if element.id == element_id:
+                return element
+        return None
+
+    def querySelectorAll(self, selector):
+        return [
+            element
+            for element in [self.documentElement, *self.documentElement._walk()]
+            if _matches(element, selector)
+        ]
+
+    def querySelector(self, selector):
+        found = self.querySelectorAll(selector)
+        return found[0] if found else None
+
+
+def _matches(element, selector):
+    """Supports "tag", "#id", "tag:not(#id)" and "#ancestor <one of those>"."""
+    parts = selector.split()
+    if not _matches_simple(element, parts[-1]):
+        return False
+    if len(parts) == 1:
+        return True
+    node = element.parentNode
+    while node is not None:
+        if _matches_simple(node, parts[0]):
+            return True
+        node = node.parentNode
+    return False
+
+
+def _matches_simple(element, simple):
+    simple, _, excluded = simple.partition(":not(")
+    if excluded and _matches_simple(element, excluded.rstrip(")")):
+        return False
+    if simple.startswith("#"):
+        return element.id == simple[1:]
+    if simple.startswith("."):
+        return simple[1:] in element.classList
+    return element.tagName == simple.upper()
+
+
+document = _Document()
+document._build()
+
+
+# --- Driving a game ---
+
+
+def press_start():
+    """
+    Does what the Play button's onclick does in button_config.js: swap in a
+    disabled start button, then let the click listeners run.
+    """
+    old_button = document.getElementById("start")
+    # The click bubbles along the path the button had when it was clicked
+    path = []
+    node = old_button
+    while node is not None:
+        path.append(node)
+        node = node.parentNode
+
+    new_button = Element("button")
+    new_button.id = "start"
+    new_button.disabled = True
+    old_button.parentNode.prepend(new_button)
+    old_button.remove()
+
+    blackout = document.getElementById("blackout")
+    if blackout is not None:
+        blackout.remove()
+
+    music = document.getElementById("bg-music")
+    if music is not None:
+        if not music.getAttribute("src") and music.getAttribute("data-src"):
+            music.src = music.getAttribute("data-src")
+        music.play()
+
+    event = _Event("click", old_button)
+    for node in path:
+        for listener in list(node.listeners.get("click", ())):
+            listener(event)
+
+
+def press_key(key):
+    document.body.dispatchEvent(_Event("keydown", document.body, key=key))
+
+
+def release_key(key):
+    document.body.dispatchEvent(_Event("keyup", document.body, key=key))
+
+
+def stats():
+    """Counters for the run so far."""
+    return {
+        "time": (clock.now - 1_000_000.0) / 1000,
+        "frames": clock.stats["frames"],
+        "callbacks": clock.stats["callbacks"],
+        "live_elements": document.live_elements,
+        "peak_elements": document.peak_elements,
+        "elements_created": document._created,
+        "draw_calls": document.draw_calls,
+        "style_writes": document.style_writes,
+        "render_calls": window.mylibraryRender.calls,
+        "sounds_played": document.sounds_played,
+        "live_proxies": _Proxy.live,
+        "peak_proxies": _Proxy.peak,
+    }
+
+
+def load_program(path, seed=None):
+    """
+    Runs the top level of the mylibrary program at `path`, leaving it
+    waiting for the start button.
+
+    Returns:
+        - The program's global variables.
+    """
+
+    global asset_root
+    asset_root = os.path.dirname(os.path.abspath(path))
+    if asset_root not in sys.path:
+        sys.path.insert(0, asset_root)
+    random.seed(seed)
+
+    with open(path) as file:
+        source = file.read()
+    namespace = {"__name__": "__main__", "__file__": path}
+    exec(compile(source, path, "exec"), namespace)
+    return namespace
+
+
+def run_program(path, seconds, seed=None, on_frame=None):
+    """
+    Runs the mylibrary program at `path`, presses start and plays it for
+    `seconds` of virtual time.
+
+    Returns:
+        - The program's global variables.
+    """
+
+    namespace = load_program(path, seed)
+    press_start()
+    clock.run_for(seconds, on_frame)
+    return namespace
+
+
+def page_text():
+    """The text of every text element on the page, e.g. to see who won."""
+    return [element.textContent for element in document.querySelectorAll("#canvas p")]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a mylibrary program headless.")
+    parser.add_argument("program", nargs="?", default="program.py")
+    parser.add_argument("--seconds", type=float, default=140)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["MYLIBRARY_HEADLESS"] = "1"
+    run_program(args.program, args.seconds, args.seed)
+
+    for text in page_text():
+        print(text)
+    for name, value in stats().items():
+        print(f"{name}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    # Run through the imported module so mylibrary and this script share
+    # one clock and one document.
+    import mylibrary_headless
+
+    sys.exit(mylibrary_headless.main())
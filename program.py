@@ -1,7 +1,30 @@
-from mylibrary import *
+from mylibrary import (
+    add_audio,
+    add_background,
+    add_background_audio,
+    add_image,
+    add_text,
+    animate_down,
+    animate_left,
+    animate_right,
+    animate_up,
+    check_collision,
+    clear,
+    keydown,
+    play_audio,
+    position_element,
+    preload_assets,
+    set_interval,
+    set_timeout,
+    update_text,
+)
 from random import randint, choice
 
 # --- GAME SETUP & ASSETS ---
+# Decode the sprites up front so the first wave doesn't stutter
+enemies = ["images/zombie1.gif", "images/bat.gif", "images/creature2.webp"]
+preload_assets(["images/wizard1.gif"] + enemies)
+
 # Set the background and load the main character
 add_background("images/grass_field.png")
 wizard = add_image("images/wizard1.gif", 50) # Wizard size is 50px
@@ -20,8 +43,9 @@ position_element(timer_text, "right", "top")
 # Background music loops automatically
 add_background_audio("audio/game-music.mp3")
 
-# Pre-load sound effects for interaction events
-ouch_sound = add_audio("audio/ouch.mp3")
+# Pre-load sound effects for interaction events. Collisions are checked
+# 20 times a second, so give "ouch" a few voices and a rate limit.
+ouch_sound = add_audio("audio/ouch.mp3", voices=3, min_interval=0.15)
 winning_sound = add_audio("audio/winning.mp3")
 losing_sound = add_audio("audio/losing.mp3")
 
@@ -30,8 +54,7 @@ losing_sound = add_audio("audio/losing.mp3")
 x = start_x
 y = start_y
 
-# Enemy configuration
-enemies = ["images/zombie1.gif", "images/bat.gif", "images/creature2.webp"]
+# Enemy configuration (the sprites are listed at the top for preloading)
 wizard_health=100
 health_text=add_text(f"Health: {wizard_health}", 20)
 position_element(health_text, "left", "top")
@@ -0,0 +1,51 @@
+// Applies the render commands mylibrary sends once per frame with
+// batch_writes(buffer=True), see _WriteQueue in mylibrary/_core.py.
+//
+// The buffer is a Float64Array of records of RECORD_SIZE numbers:
+//   element key, left (px), top (px), transform function, transform amount, opacity
+// NaN leaves a value as it is. A negative key means the element has left the
+// page and can be forgotten.
+(function () {
+    const RECORD_SIZE = 6;
+    // Transform function number -> [name, unit]
+    const TRANSFORMS = [null, ["translateX", "px"], ["translateY", "px"], ["rotate", "deg"]];
+    // Element key -> element
+    const elements = new Map();
+
+    window.mylibraryRender = {
+        register(key, element) {
+            elements.set(key, element);
+        },
+
+        apply(buffer) {
+            for (let i = 0; i < buffer.length; i += RECORD_SIZE) {
+                const key = buffer[i];
+                if (key < 0) {
+                    elements.delete(-key);
+                    continue;
+                }
+                const element = elements.get(key);
+                if (!element) {
+                    continue;
+                }
+                const style = element.style;
+                if (!Number.isNaN(buffer[i + 1])) {
+                    style.left = buffer[i + 1] + "px";
+                }
+                if (!Number.isNaN(buffer[i + 2])) {
+                    style.top = buffer[i + 2] + "px";
+                }
+                const transform = buffer[i + 3];
+                if (transform === 0) {
+                    style.transform = "";
+                } else if (!Number.isNaN(transform)) {
+                    const [name, unit] = TRANSFORMS[transform];
+                    style.transform = `${name}(${buffer[i + 4]}${unit})`;
+                }
+                if (!Number.isNaN(buffer[i + 5])) {
+                    style.opacity = buffer[i + 5];
+                }
+            }
+        },
+    };
+})();
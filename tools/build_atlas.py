@@ -0,0 +1,175 @@
+"""
+Packs a directory of images into one atlas texture plus a JSON frame map
+that mylibrary.load_atlas() reads, so a game loads one image instead of one
+per sprite.
+
+Frames are keyed by the same filename a game passes to add_image() (e.g.
+"images/bat.gif"), so loading the atlas is the only change the game needs.
+Animated images contribute their first frame, or with --animated every
+frame as a spritesheet that mylibrary plays on one shared clock. Needs
+Pillow (pip install pillow).
+
+Example usage:
+    python tools/build_atlas.py images --animated --max-frame 128 \
+        --exclude "Game screenshot.png" --exclude grass_field.png
+"""
+
+import os
+import sys
+import json
+import fnmatch
+import argparse
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+IMAGE_EXTENSIONS = (".png", ".gif", ".webp", ".jpg", ".jpeg")
+
+
+def find_images(directory, exclude=(), skip=()):
+    """Returns the image files in `directory`, minus any matching `exclude`."""
+    found = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if not name.lower().endswith(IMAGE_EXTENSIONS) or not os.path.isfile(path):
+            continue
+        if any(fnmatch.fnmatch(name, pattern) for pattern in exclude):
+            continue
+        if os.path.abspath(path) in skip:
+            continue
+        found.append(path)
+    return found
+
+
+def load_frames(path, max_frame, animated=False):
+    """
+    Returns [(frame as RGBA, duration in ms)] for the image, scaled down to
+    fit `max_frame`. Only the first frame unless `animated`.
+    """
+
+    image = Image.open(path)
+    count = getattr(image, "n_frames", 1) if animated else 1
+    frames = []
+    for index in range(count):
+        image.seek(index)
+        # Browsers play very short frame delays at 100ms
+        duration = image.info.get("duration") or 100
+        frame = image.convert("RGBA")
+        if max_frame and max(frame.size) > max_frame:
+            frame.thumbnail((max_frame, max_frame), Image.LANCZOS)
+        frames.append((frame, duration if duration > 10 else 100))
+    return frames
+
+
+def pack(sizes, padding=2, max_width=2048):
+    """
+    Places rectangles on shelves, tallest first.
+
+    Parameters:
+        - sizes (list): (width, height) of each rectangle.
+        - padding (int): Empty pixels kept between rectangles.
+        - max_width (int): The widest the atlas may be.
+
+    Returns:
+        - ([(x, y) for each size, in the same order], width, height)
+    """
+
+    area = sum((w + padding) * (h + padding) for w, h in sizes)
+    widest = max((w for w, h in sizes), default=0) + padding
+    # Aim for a roughly square atlas
+    width = 64
+    while width * width < area or width < widest:
+        width *= 2
+    width = min(width, max(max_width, widest))
+
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[index]
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        positions[index] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return positions, width, y + shelf_height
+
+
+def build_atlas(paths, output, root=".", max_frame=256, padding=2, max_width=2048,
+                animated=False):
+    """
+    Packs `paths` into `output` + ".png" and writes the frame map to
+    `output` + ".json". With `animated`, an image with several frames gets an
+    "animation" list of every frame's position and duration.
+
+    Returns:
+        - The frame map.
+    """
+
+    frames = {path: load_frames(path, max_frame, animated) for path in paths}
+    packed = [frame for path in paths for frame, duration in frames[path]]
+    positions, width, height = pack([frame.size for frame in packed], padding, max_width)
+
+    atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    for frame, position in zip(packed, positions):
+        atlas.paste(frame, position)
+
+    def url(path):
+        return os.path.relpath(path, root).replace(os.sep, "/")
+
+    frame_map = {"image": url(output + ".png"), "width": width, "height": height, "frames": {}}
+    positions = iter(positions)
+    for path in paths:
+        first = frames[path][0][0]
+        entries = [
+            {"x": x, "y": y, "duration": duration}
+            for (frame, duration), (x, y) in zip(frames[path], positions)
+        ]
+        entry = {"x": entries[0]["x"], "y": entries[0]["y"], "w": first.size[0], "h": first.size[1]}
+        if len(entries) > 1:
+            entry["animation"] = entries
+        frame_map["frames"][url(path)] = entry
+
+    atlas.save(output + ".png", optimize=True)
+    with open(output + ".json", "w") as file:
+        json.dump(frame_map, file, indent=2)
+    return frame_map
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack images into a sprite atlas for mylibrary.")
+    parser.add_argument("directory", nargs="?", default="images")
+    parser.add_argument("--output", help="atlas path without extension (default: <directory>/atlas)")
+    parser.add_argument("--root", default=".", help="directory add_image() paths are relative to")
+    parser.add_argument("--exclude", action="append", default=[], help="filename pattern to skip")
+    parser.add_argument("--max-frame", type=int, default=256,
+                        help="scale frames down to fit this many pixels (0 keeps full size)")
+    parser.add_argument("--animated", action="store_true",
+                        help="pack every frame of animated images, not just the first")
+    parser.add_argument("--padding", type=int, default=2)
+    parser.add_argument("--max-width", type=int, default=2048)
+    args = parser.parse_args(argv)
+
+    if Image is None:
+        print("build_atlas.py needs Pillow: pip install pillow", file=sys.stderr)
+        return 1
+
+    output = args.output or os.path.join(args.directory, "atlas")
+    paths = find_images(args.directory, args.exclude, skip={os.path.abspath(output + ".png")})
+    if not paths:
+        print(f"No images found in {args.directory}", file=sys.stderr)
+        return 1
+
+    frame_map = build_atlas(
+        paths, output, args.root, args.max_frame, args.padding, args.max_width, args.animated
+    )
+    print(f"Packed {len(paths)} images into {frame_map['image']} "
+          f"({frame_map['width']}x{frame_map['height']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
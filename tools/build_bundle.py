@@ -0,0 +1,101 @@
+"""
+Precompiles the mylibrary package and program.py into bundle.zip, so the
+browser can import bytecode instead of compiling the sources on every page
+load. Run it from the project root: files are named by their path from there.
+
+The bytecode only works on the Python version it was compiled with, so run
+this with the same version Pyodide uses (3.10 for Pyodide 0.20). The loader
+in button_config.js checks the bundle's magic number, that it has the same
+files it fetched, and the SHA-256 of each source against them, and uses the
+sources instead when the bundle is stale.
+
+Example usage:
+    python3.10 tools/build_bundle.py
+"""
+
+import os
+import sys
+import json
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import py_compile
+import importlib.util
+
+PYODIDE_PYTHON = (3, 10)
+
+
+def find_sources(paths):
+    """Returns `paths` with each directory replaced by the .py files in it."""
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            sources.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".py")
+            )
+        else:
+            sources.append(path)
+    return sources
+
+
+def build_bundle(sources, output):
+    """
+    Compiles each of `sources` into `output`, a zip of .pyc files plus a
+    bundle.json of the magic number and source hashes. Each file keeps its
+    path relative to the current directory, so packages import from the zip.
+
+    Returns:
+        - The contents of bundle.json.
+    """
+
+    manifest = {
+        "python": "%d.%d" % sys.version_info[:2],
+        "magic": importlib.util.MAGIC_NUMBER.hex(),
+        "sources": {},
+    }
+
+    with tempfile.TemporaryDirectory() as temp, zipfile.ZipFile(
+        output, "w", zipfile.ZIP_DEFLATED
+    ) as bundle:
+        for source in sources:
+            name = os.path.relpath(source).replace(os.sep, "/")
+            compiled = os.path.join(temp, name.replace("/", "_") + "c")
+            # Hash-based and unchecked, because the bundle holds no sources
+            # to check against; the loader compares hashes itself
+            py_compile.compile(
+                source,
+                cfile=compiled,
+                dfile=name,
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+            bundle.write(compiled, name + "c")
+            with open(source, "rb") as file:
+                manifest["sources"][name] = hashlib.sha256(file.read()).hexdigest()
+
+        bundle.writestr("bundle.json", json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompile the game into bundle.zip.")
+    parser.add_argument("sources", nargs="*", default=["mylibrary", "program.py"],
+                        help="files, or directories of .py files, to compile")
+    parser.add_argument("--output", default="bundle.zip")
+    args = parser.parse_args(argv)
+
+    if sys.version_info[:2] != PYODIDE_PYTHON:
+        print(
+            "Warning: Pyodide runs Python %d.%d, so it will ignore bytecode from %d.%d "
+            "and compile the sources instead." % (PYODIDE_PYTHON + sys.version_info[:2]),
+            file=sys.stderr,
+        )
+
+    manifest = build_bundle(find_sources(args.sources), args.output)
+    print(f"Wrote {args.output} ({', '.join(manifest['sources'])}, Python {manifest['python']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())